@@ -0,0 +1,209 @@
+"""End-to-end render benchmark with a baseline regression gate.
+
+Renders every scene of an animation script (``taylor_series_hq.py`` by
+default) at each requested quality, one ``manim`` process at a time so
+the timings do not compete for cores, into a temporary media directory.
+For every scene and quality it records the wall time, the frames of
+video produced per second of wall time, the peak resident memory of
+the manim process, the size of the video file and how often the
+renderer had to wait for the encoder (see ``frame_writer.FrameRing``).
+``-q k`` measures the 4K throughput and memory of the frame pipeline.
+
+``--baseline`` compares the run against an earlier one and exits with
+status 1 when any scene got slower than ``--threshold`` (25% by
+default), listing the offenders; ``--save`` stores the run, e.g. as the
+new baseline::
+
+    python bench_render.py --save bench/render-baseline.json
+    python bench_render.py --baseline bench/render-baseline.json
+    python bench_render.py HyperbolicExample -q h --baseline bench/render-baseline.json
+    python bench_render.py SineExample -q k
+
+Peak memory is only measured where ``os.wait4`` exists (Linux, macOS).
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from render_all import QUALITIES, find_scenes
+
+
+# Fractional slowdown of a scene that fails the gate
+THRESHOLD = 0.25
+
+
+def render_scene(script, scene, quality, media_dir, manim_args=()):
+    """Render ``scene`` at ``quality`` into ``media_dir`` and measure the run."""
+    command = [
+        sys.executable, "-m", "manim", "render", f"-q{quality}", "--media_dir", str(media_dir),
+        *manim_args, str(script), scene,
+    ]
+    log_path = Path(media_dir) / f"{scene}-{quality}.log"
+    start = time.perf_counter()
+    with open(log_path, "w") as log:
+        process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT)
+        peak_rss = None
+        if hasattr(os, "wait4"):
+            _, status, usage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+            peak_rss = usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+        else:
+            process.wait()
+    seconds = time.perf_counter() - start
+
+    result = {
+        "scene": scene,
+        "quality": quality,
+        "returncode": process.returncode,
+        "seconds": round(seconds, 3),
+        "peak_rss_mb": None if peak_rss is None else round(peak_rss / 2**20, 1),
+        "frames": None,
+        "fps": None,
+        "output_mb": None,
+        "encoder_waits": None,
+        "log": str(log_path),
+    }
+    # Frame counts as reported by frame_writer.StatsRenderer
+    stats_path = Path(media_dir) / "render_stats" / f"{scene}.json"
+    if stats_path.exists():
+        with open(stats_path) as f:
+            stats = json.load(f)
+        result["frames"] = stats["frames_emitted"]
+        result["encoder_waits"] = stats.get("ring_waits")
+        result["fps"] = round(result["frames"] / seconds, 2)
+    videos = sorted(Path(media_dir).glob(f"videos/**/{scene}.mp4"))
+    if videos:
+        result["output_mb"] = round(videos[-1].stat().st_size / 2**20, 3)
+    return result
+
+
+def run(script, scenes, qualities, manim_args=(), repeat=1):
+    """Benchmark every scene at every quality, keeping each one's fastest run."""
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_render_") as media_dir:
+        for quality in qualities:
+            for scene in scenes:
+                runs = []
+                for _ in range(repeat):
+                    # A fresh media directory, so no partial movie is reused
+                    run_dir = tempfile.mkdtemp(dir=media_dir)
+                    runs.append(render_scene(script, scene, quality, run_dir, manim_args))
+                result = min(runs, key=lambda run: (run["returncode"] != 0, run["seconds"]))
+                print(_format_result(result), flush=True)
+                if result["returncode"] != 0:
+                    # The log goes away with the temporary directory
+                    result["log"] = Path(result["log"]).read_text()[-2000:]
+                    print(result["log"], flush=True)
+                results.append(result)
+    return results
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """Print the run against ``baseline`` and return the regressions.
+
+    A regression is a scene that failed to render, or that took more than
+    ``1 + threshold`` times its baseline wall time.
+    """
+    before = {(result["scene"], result["quality"]): result for result in baseline["results"]}
+    regressions = []
+    print(f"\nAgainst {baseline.get('commit') or 'baseline'} (threshold +{threshold:.0%}):")
+    print(f"{'scene':<28} q {'seconds':>17} {'change':>8} {'fps':>15} {'peak RSS MB':>17}")
+    for result in results:
+        old = before.get((result["scene"], result["quality"]))
+        if result["returncode"] != 0:
+            regressions.append(f"{result['scene']} -q{result['quality']}: render failed")
+            continue
+        if old is None:
+            print(f"{result['scene']:<28} {result['quality']} {'':>9}{result['seconds']:>8.1f}  (new)")
+            continue
+        change = result["seconds"] / old["seconds"] - 1
+        flag = ""
+        if change > threshold:
+            flag = "  SLOWER"
+            regressions.append(
+                f"{result['scene']} -q{result['quality']}: {old['seconds']:.1f}s -> {result['seconds']:.1f}s "
+                f"({change:+.0%}, threshold +{threshold:.0%})"
+            )
+        print(
+            f"{result['scene']:<28} {result['quality']} {old['seconds']:>8.1f}{result['seconds']:>9.1f} "
+            f"{change:>+8.0%} {_number(old['fps']):>7}{_number(result['fps']):>8} "
+            f"{_number(old['peak_rss_mb']):>8}{_number(result['peak_rss_mb']):>9}{flag}"
+        )
+    return regressions
+
+
+def _format_result(result):
+    if result["returncode"] != 0:
+        return f"{result['scene']:<28} -q{result['quality']}  FAILED ({result['returncode']})"
+    return (
+        f"{result['scene']:<28} -q{result['quality']} {result['seconds']:>8.1f}s "
+        f"{_number(result['fps']):>8} fps {_number(result['peak_rss_mb']):>8} MB peak "
+        f"{_number(result['output_mb']):>8} MB video {_number(result['encoder_waits']):>6} encoder waits"
+    )
+
+
+def _number(value):
+    return "-" if value is None else f"{value:g}"
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    manim_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, manim_args = argv[:split], argv[split + 1:]
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenes", nargs="*", help="scenes to render (default: all)")
+    parser.add_argument("--script", default="taylor_series_hq.py", help="animation script to benchmark")
+    parser.add_argument("-q", "--quality", action="append", choices=QUALITIES,
+                        help="manim quality flag, may be repeated (default: l and h)")
+    parser.add_argument("--repeat", type=int, default=1, help="renders per scene, keeping the fastest")
+    parser.add_argument("--baseline", help="JSON file of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help=f"allowed fractional slowdown per scene (default: {THRESHOLD})")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    scenes = args.scenes or find_scenes(args.script)
+    results = run(args.script, scenes, args.quality or ["l", "h"], manim_args, args.repeat)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({
+                "script": args.script,
+                "commit": _commit(),
+                "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "machine": platform.platform(),
+                "results": results,
+            }, f, indent=2)
+
+    failed = [result for result in results if result["returncode"] != 0]
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s):")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("\nNo scene regressed.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+"""Micro-benchmarks for the series math and plotting hot paths.
+
+Times each step the scenes pay for before a single frame is rendered,
+in isolation and for every standard series:
+
+* ``coefficients`` -- the coefficient table, and expanding the NumPy
+  function with :mod:`jets` and :mod:`cauchy`;
+* ``evaluation`` -- one partial sum on 1e3 to 1e7 points, by Horner's
+  scheme, as a progression of :class:`~taylor_polynomial.PartialSums`,
+  and as the term-by-term ``sum(...)`` lambdas the scenes used to plot;
+* ``sampling`` -- per example scene of ``taylor_series_hq.py``:
+  ``axes.plot``, the adaptive sample grid and the bezier construction
+  of the whole progression;
+* ``tex`` -- ``MathTex`` of every example formula, fresh and through
+  :mod:`tex_cache`.
+
+The last two groups need manim (and LaTeX for ``tex``) and are reported
+as skipped without them.  Every result holds the best and median time
+per call; ``--json`` saves them together with the commit, and
+``--compare`` prints the speedup against an earlier run::
+
+    python bench_series.py --json bench/series-before.json
+    python bench_series.py --quick --compare bench/series-before.json
+"""
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+
+import numpy as np
+
+from cauchy import cauchy_coefficients
+from jets import taylor_coefficients
+from taylor_polynomial import FUNCTIONS, PartialSums, TaylorPolynomial, build_coefficient_table, coefficients
+
+
+GROUPS = ["coefficients", "evaluation", "sampling", "tex"]
+
+# Degrees expanded by the coefficient benchmarks
+DEGREES = [10, 64, 256]
+
+# Points evaluated by the evaluation benchmarks, and --quick's subset
+SIZES = [10**3, 10**4, 10**5, 10**6, 10**7]
+QUICK_SIZES = [10**3, 10**5]
+
+# Degree of the partial sums evaluated, the highest the examples show
+EVALUATION_DEGREE = 10
+
+
+def measure(function, repeat=5):
+    """Best and median seconds per call of ``function()``.
+
+    Each of the ``repeat`` timings runs enough calls to take at least
+    0.2 seconds, as ``timeit`` does on the command line.
+    """
+    timer = timeit.Timer(function)
+    loops, _ = timer.autorange()
+    times = [seconds / loops for seconds in timer.repeat(repeat=repeat, number=loops)]
+    return {"loops": loops, "best": min(times), "median": statistics.median(times)}
+
+
+def bench_coefficients():
+    for degree in DEGREES:
+        yield "table", "all", {"degree": degree}, lambda: build_coefficient_table(degree)
+    for name, f in FUNCTIONS.items():
+        for degree in DEGREES:
+            yield "jets", name, {"degree": degree}, lambda: taylor_coefficients(f, 0.0, degree)
+            yield "cauchy", name, {"degree": degree}, lambda: cauchy_coefficients(f, 0.0, degree)
+
+
+def bench_evaluation(sizes):
+    for name in FUNCTIONS:
+        c = coefficients(name, EVALUATION_DEGREE)
+        polynomial = TaylorPolynomial(c)
+        # The scenes' original lambdas: one array expression per term
+        term_by_term = lambda x: sum([c[k] * x**k for k in range(len(c))])
+        for size in sizes:
+            # Inside every series' interval of convergence
+            x = np.linspace(-0.9, 0.9, size)
+            params = {"degree": EVALUATION_DEGREE, "points": size}
+            yield "horner", name, params, lambda: polynomial(x)
+            yield "partial_sums", name, params, lambda: _progression(c, x)
+            yield "term_by_term", name, params, lambda: term_by_term(x)
+
+
+def _progression(c, x):
+    partial_sums = PartialSums(c, x)
+    for degree in range(len(c)):
+        partial_sums.advance(degree)
+        partial_sums.slopes()
+
+
+def bench_sampling():
+    from taylor_plotting import make_axes, plot_samples, sample_grid
+
+    for name, spec in _example_specs():
+        axes = make_axes(**spec["axes"])
+        f = FUNCTIONS[spec["function"]]
+        c = coefficients(spec["series"], spec["degrees"][-1][0])
+        curves = [TaylorPolynomial(c[:n + 1]) for n, _ in spec["degrees"]]
+        grid = sample_grid(axes, axes.x_range, curves=curves)
+        samples = []
+        partial_sums = PartialSums(c, grid)
+        for (n, _), curve in zip(spec["degrees"], curves):
+            samples.append((partial_sums.advance(n), partial_sums.slopes(), curve))
+
+        def build_beziers():
+            for y, slopes, curve in samples:
+                plot_samples(axes, grid, y, slopes=slopes, function=curve, derivative=curve.derivative())
+
+        params = {"points": len(grid)}
+        yield "axes_plot", name, {}, lambda: [axes.plot(curve, use_vectorized=True) for curve in curves]
+        yield "function_plot", name, {}, lambda: axes.plot(f, x_range=spec.get("function_range") or axes.x_range)
+        yield "sample_grid", name, params, lambda: sample_grid(axes, axes.x_range, curves=curves)
+        yield "beziers", name, params, build_beziers
+
+
+def bench_tex():
+    from manim import MathTex
+
+    from tex_cache import cached_math_tex
+
+    for name, spec in _example_specs():
+        for key in ["formula", "expanded"]:
+            yield "math_tex", name, {"part": key}, lambda: MathTex(spec[key])
+            yield "cached_math_tex", name, {"part": key}, lambda: cached_math_tex(spec[key])
+
+
+def _example_specs():
+    """``(scene name, spec)`` of every example scene in ``taylor_series_hq.py``."""
+    import taylor_series_hq
+    from taylor_examples import DEFAULT_SPEC, TaylorExampleScene
+
+    for name, obj in vars(taylor_series_hq).items():
+        if isinstance(obj, type) and issubclass(obj, TaylorExampleScene) and obj.spec:
+            yield name, {**DEFAULT_SPEC, **obj.spec}
+
+
+def _skip_reason(group):
+    if group in ("sampling", "tex"):
+        try:
+            import manim  # noqa: F401
+        except ImportError:
+            return "manim is not installed"
+    if group == "tex" and shutil.which("latex") is None:
+        return "latex is not on the PATH"
+    return None
+
+
+def run(groups, quick=False, repeat=5):
+    """Run the benchmarks of ``groups`` and return their results in order.
+
+    Each benchmark is timed as soon as its generator yields it, so the
+    lambdas may refer to the generator's loop variables.
+    """
+    results = []
+    for group in groups:
+        reason = _skip_reason(group)
+        if reason:
+            print(f"{group}: skipped ({reason})", flush=True)
+            results.append({"group": group, "skipped": reason})
+            continue
+        if group == "coefficients":
+            benchmarks = bench_coefficients()
+        elif group == "evaluation":
+            benchmarks = bench_evaluation(QUICK_SIZES if quick else SIZES)
+        elif group == "sampling":
+            benchmarks = bench_sampling()
+        else:
+            benchmarks = bench_tex()
+        for benchmark, function, params, call in benchmarks:
+            timing = measure(call, repeat)
+            result = {"group": group, "benchmark": benchmark, "function": function, "params": params, **timing}
+            print(f"{_key(result):<58} {_format_seconds(timing['best']):>10} {_format_seconds(timing['median']):>10}",
+                  flush=True)
+            results.append(result)
+    return results
+
+
+def compare(results, baseline):
+    """Print the speedup of every benchmark that also appears in ``baseline``."""
+    before = {_key(result): result for result in baseline["results"] if "best" in result}
+    print(f"\nSpeedup against {baseline.get('commit') or 'baseline'} (best times):")
+    for result in results:
+        if "best" in result and _key(result) in before:
+            old = before[_key(result)]["best"]
+            print(f"{_key(result):<58} {_format_seconds(old):>10} -> {_format_seconds(result['best']):>10}"
+                  f"  x{old / result['best']:.2f}")
+
+
+def _key(result):
+    params = ",".join(f"{name}={value}" for name, value in result["params"].items())
+    return f"{result['group']}/{result['benchmark']}/{result['function']}" + (f"[{params}]" if params else "")
+
+
+def _format_seconds(seconds):
+    for unit, scale in [("s", 1), ("ms", 1e-3), ("us", 1e-6)]:
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("groups", nargs="*", help=f"benchmark groups to run: {', '.join(GROUPS)} (default: all)")
+    parser.add_argument("--quick", action="store_true", help="only evaluate up to 1e5 points")
+    parser.add_argument("--repeat", type=int, default=5, help="timings per benchmark")
+    parser.add_argument("--json", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON file of an earlier run to compare against")
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.groups) - set(GROUPS))
+    if unknown:
+        parser.error(f"unknown groups {', '.join(unknown)}; expected some of {', '.join(GROUPS)}")
+
+    results = run(args.groups or GROUPS, args.quick, args.repeat)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "commit": _commit(),
+                "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "machine": platform.platform(),
+                "results": results,
+            }, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,471 @@
+"""Renderer and file writer that rasterize and encode only what changes.
+
+Most of the runtime of the scenes is spent in ``self.wait(...)``.  When
+nothing moves, manim's Cairo renderer already rasterizes the frame of a
+wait only once, but the file writer still hands that frame to the
+encoder once per output frame: a 3 second wait at 60 fps encodes 180
+identical frames.  :class:`HoldFileWriter` instead timestamps the held
+frame explicitly and encodes it only at the start and the end of the
+hold, so the video has the same timeline while the encoder sees two
+frames instead of hundreds.
+
+:class:`StatsRenderer` counts, per scene, the frames rasterized for
+the video (not the static backgrounds drawn along the way), the frames
+in the output video and the frames actually encoded, logs them when the
+scene finishes and writes them to
+``<media_dir>/render_stats/<Scene>.json``.  Set ``TAYLOR_HOLD_FRAMES=off``
+to encode every frame again (the counts are still reported).  GIF output
+(``--format gif``) always gets every frame: manim rebuilds the GIF from
+the partial movies with consecutive timestamps, which would shorten each
+hold to two frames.
+
+During an animation, manim draws the mobjects that do not move once
+into a background image, but only those that come before the first
+moving mobject in drawing order: everything added after it is redrawn
+on every frame, however static.  In the example scenes that is the
+label box, the labels and often the reference curve.  With
+:class:`~taylor_scene.TaylorScene` marking only the animated mobjects
+as moving, :class:`StatsRenderer` also prerenders each run of static
+mobjects drawn above a moving one into a transparent overlay, cropped to
+its pixels, and per frame draws just the moving mobjects and blends the
+overlays in between, so each frame costs what moves.  Set
+``TAYLOR_LAYERS=off`` to draw every frame the way manim does.
+
+manim's file writer already encodes on a thread of its own, but the
+renderer hands it a freshly allocated copy of every frame through an
+unbounded queue: at 4K that is a new 33 MB array per frame, and when the
+encoder falls behind the copies pile up in memory.
+:class:`HoldFileWriter` instead copies each frame into one of
+``TAYLOR_FRAME_RING`` (4 by default) buffers of a :class:`FrameRing`,
+allocated once, which the writer thread hands back once the frame is
+encoded; the renderer only waits when every buffer is still queued.
+This bounds memory and drops the per-frame allocation on the renderer's
+side, but it is not a zero-copy hand-off: the buffers are ordinary
+NumPy arrays in this process, not shared memory, each frame is still
+copied into its buffer with one ``np.copyto``, and
+``av.VideoFrame.from_ndarray`` still allocates a frame of its own for
+the encoder.  Set ``TAYLOR_FRAME_RING=off`` to queue frame copies as
+manim does.  The stats report how often the renderer waited, the frames
+per second produced and the peak memory of the process.
+
+``TAYLOR_RENDITIONS`` adds smaller renditions of the video, encoded by
+the writer thread from the same frames, so one render publishes several
+resolutions without building and rasterizing the scene again::
+
+    TAYLOR_RENDITIONS=720p30,480p15,480p10.gif manim -qh taylor_series_hq.py SineExample
+
+Each entry is ``<height>p[<frame rate>][.<format>]``: ``mp4`` (the
+default), ``webm`` or ``gif``, at the frame rate of the render unless
+given.  An MP4 rendition is written to the folder ``manim -q...`` would
+use for that resolution, other formats next to the main video.  Partial
+movie caching is turned off while renditions are requested, since frames
+of cached animations are never rasterized.
+"""
+import json
+import math
+from fractions import Fraction
+import os
+import queue
+import re
+import sys
+import time
+from pathlib import Path
+
+import av
+import numpy as np
+from manim import __version__ as manim_version, config, logger
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.file_ops import write_to_movie
+from manim.utils.iterables import list_update
+
+from tracing import traced
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# The manim internals this module overrides or calls; the file writer was
+# reworked after 0.19, so fail here rather than in the middle of a render
+for _owner, _names in (
+    (SceneFileWriter, ("write_frame", "encode_and_write_frame", "listen_and_write", "open_partial_movie_stream",
+                       "finish")),
+    (CairoRenderer, ("render", "update_frame", "save_static_frame_data", "add_frame", "get_frame")),
+):
+    _missing = [name for name in _names if not hasattr(_owner, name)]
+    if _missing:
+        raise ImportError(
+            f"frame_writer needs manim>=0.19,<0.20, but {_owner.__name__} in manim {manim_version} "
+            f"has no {', '.join(_missing)}"
+        )
+
+
+HOLD_FRAMES = os.environ.get("TAYLOR_HOLD_FRAMES", "").lower() != "off"
+LAYERS = os.environ.get("TAYLOR_LAYERS", "").lower() != "off"
+_ring_setting = os.environ.get("TAYLOR_FRAME_RING", "")
+RING_FRAMES = 0 if _ring_setting.lower() == "off" else int(_ring_setting or 4)
+
+
+def renditions_setting():
+    """The current ``TAYLOR_RENDITIONS``, read when a scene starts rather than at import."""
+    return os.environ.get("TAYLOR_RENDITIONS", "")
+
+
+def parse_renditions(setting):
+    """``(height, frame rate or None, extension)`` of every entry of a renditions setting."""
+    renditions = []
+    for entry in filter(None, (entry.strip() for entry in setting.split(","))):
+        match = re.fullmatch(r"(\d+)p(\d+)?(\.(mp4|webm|gif))?", entry.lower())
+        if match is None:
+            raise ValueError(f"bad rendition {entry!r}, expected e.g. 720p30, 480p or 480p10.gif")
+        height, frame_rate, extension = match.group(1, 2, 3)
+        renditions.append((int(height), frame_rate and int(frame_rate), extension or ".mp4"))
+    return renditions
+
+
+class Rendition:
+    """One downscaled output encoded alongside the main video.
+
+    Frames come with their position in the scene's frame sequence, at
+    ``source_rate``, and the number of frames they are shown for; each
+    output frame shows the source frame on screen at its time, so lower
+    frame rates drop frames instead of speeding up.
+    """
+
+    # Codec and pixel format per container
+    CODECS = {".mp4": ("libx264", "yuv420p"), ".webm": ("libvpx-vp9", "yuv420p"), ".gif": ("gif", "rgb8")}
+
+    def __init__(self, path, width, height, frame_rate, source_rate):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        codec, self.pixel_format = self.CODECS[self.path.suffix]
+        self.container = av.open(str(self.path), mode="w")
+        self.stream = self.container.add_stream(codec, rate=Fraction(frame_rate).limit_denominator(1001))
+        self.stream.width = width
+        self.stream.height = height
+        self.stream.pix_fmt = self.pixel_format
+        self.scale = frame_rate / source_rate
+        self.last_pts = -1
+
+    def encode(self, frame, source_index, num_frames):
+        """Encode ``frame`` (an ``av.VideoFrame``) shown from ``source_index`` for ``num_frames``."""
+        # Output frames falling within the time the source frame is shown
+        first = math.ceil(source_index * self.scale - 1e-9)
+        last = math.ceil((source_index + num_frames) * self.scale - 1e-9) - 1
+        timestamps = [pts for pts in sorted({first, last}) if first <= pts and pts > self.last_pts]
+        if not timestamps or timestamps[0] > last:
+            return
+        scaled = frame.reformat(width=self.stream.width, height=self.stream.height, format=self.pixel_format)
+        for pts in timestamps:
+            scaled.pts = pts
+            for packet in self.stream.encode(scaled):
+                self.container.mux(packet)
+        self.last_pts = timestamps[-1]
+
+    def close(self):
+        for packet in self.stream.encode():
+            self.container.mux(packet)
+        self.container.close()
+
+
+class FrameRing:
+    """Preallocated frame buffers passed round between the renderer and the writer thread.
+
+    Plain arrays of this process: the renderer still copies each frame
+    into one, so the ring bounds memory rather than removing the copy.
+    """
+
+    def __init__(self, shape, size):
+        self.frames = [np.empty(shape, dtype=np.uint8) for _ in range(size)]
+        self._indices = {id(frame): index for index, frame in enumerate(self.frames)}
+        self._free = queue.SimpleQueue()
+        for index in range(size):
+            self._free.put(index)
+        # Frames for which the renderer had to wait on the encoder
+        self.waits = 0
+
+    def acquire(self, writer=None):
+        """A buffer no queued frame uses, waiting for the encoder if there is none.
+
+        Raises ``RuntimeError`` if the ``writer`` thread dies meanwhile.
+        """
+        try:
+            index = self._free.get_nowait()
+        except queue.Empty:
+            self.waits += 1
+            while True:
+                try:
+                    index = self._free.get(timeout=1)
+                    break
+                except queue.Empty:
+                    if writer is not None and not writer.is_alive():
+                        raise RuntimeError("the frame writer thread stopped") from None
+        return self.frames[index]
+
+    def release(self, frame):
+        """Hand ``frame`` back once it is encoded; frames not from the ring are ignored."""
+        index = self._indices.get(id(frame))
+        if index is not None:
+            self._free.put(index)
+
+
+class HoldFileWriter(SceneFileWriter):
+    """Scene file writer that encodes a run of identical frames as two frames.
+
+    Frames are queued for the writer thread in the buffers of a
+    :class:`FrameRing`, so they can be passed in the renderer's own pixel
+    array.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.frames_encoded = 0
+        self.ring = None
+        # Frames of the scene so far, and the extra outputs fed from them
+        self.scene_frames = 0
+        self.rendition_setting = renditions_setting()
+        self.renditions = None
+        super().__init__(*args, **kwargs)
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        if RING_FRAMES and write_to_movie() and isinstance(frame_or_renderer, np.ndarray):
+            if self.ring is None or self.ring.frames[0].shape != frame_or_renderer.shape:
+                self.ring = FrameRing(frame_or_renderer.shape, RING_FRAMES)
+            frame = self.ring.acquire(getattr(self, "writer_thread", None))
+            np.copyto(frame, frame_or_renderer)
+            frame_or_renderer = frame
+        super().write_frame(frame_or_renderer, num_frames)
+
+    def open_partial_movie_stream(self, *args, **kwargs):
+        # Presentation timestamp of the next frame, in frames
+        self.next_pts = 0
+        super().open_partial_movie_stream(*args, **kwargs)
+
+    @traced("encode", "encode frame")
+    def encode_and_write_frame(self, frame, num_frames):
+        try:
+            self._encode_and_write_frame(frame, num_frames)
+            if self.rendition_setting:
+                self.encode_renditions(frame, num_frames)
+            self.scene_frames += num_frames
+        finally:
+            if self.ring is not None:
+                self.ring.release(frame)
+
+    def encode_renditions(self, frame, num_frames):
+        if self.renditions is None:
+            self.renditions = self.open_renditions(frame.shape[1], frame.shape[0])
+        if not self.renditions:
+            return
+        av_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+        for rendition in self.renditions:
+            rendition.encode(av_frame, self.scene_frames, num_frames)
+
+    def open_renditions(self, width, height):
+        """The :class:`Rendition` outputs requested by ``TAYLOR_RENDITIONS``."""
+        movie_path = Path(self.movie_file_path)
+        source_rate = config.frame_rate
+        renditions = []
+        for rendition_height, frame_rate, extension in parse_renditions(self.rendition_setting):
+            if rendition_height > height:
+                logger.warning(f"Skipping the {rendition_height}p rendition of a {height}p render")
+                continue
+            frame_rate = frame_rate or source_rate
+            if extension == ".mp4":
+                # Where `manim -q...` puts a video of that resolution
+                path = movie_path.parent.parent / f"{rendition_height}p{frame_rate:g}" / movie_path.name
+            else:
+                path = movie_path.with_name(f"{movie_path.stem}_{rendition_height}p{frame_rate:g}{extension}")
+            # Codecs want even dimensions
+            rendition_width = round(width * rendition_height / height / 2) * 2
+            renditions.append(Rendition(path, rendition_width, rendition_height, frame_rate, source_rate))
+        return renditions
+
+    def finish(self):
+        super().finish()
+        for rendition in self.renditions or []:
+            rendition.close()
+            logger.info(f"Rendition written to {rendition.path}")
+
+    def holds_frames(self):
+        """Whether held frames are encoded as two frames; never for GIF output."""
+        return HOLD_FRAMES and config.format != "gif" and config.movie_file_extension != ".gif"
+
+    def _encode_and_write_frame(self, frame, num_frames):
+        if not self.holds_frames():
+            self.frames_encoded += num_frames
+            super().encode_and_write_frame(frame, num_frames)
+            return
+        # The first and last frame of the hold pin down its place in the
+        # timeline; players show the first one until the last one is due
+        timestamps = [self.next_pts]
+        if num_frames > 1:
+            timestamps.append(self.next_pts + num_frames - 1)
+        for pts in timestamps:
+            av_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+            av_frame.pts = pts
+            for packet in self.video_stream.encode(av_frame):
+                self.video_container.mux(packet)
+        self.next_pts += num_frames
+        self.frames_encoded += len(timestamps)
+
+
+class Overlay:
+    """Prerendered static mobjects, blended over the frame below them."""
+
+    def __init__(self, pixels):
+        alpha = pixels[:, :, 3]
+        rows = np.flatnonzero(alpha.any(axis=1))
+        columns = np.flatnonzero(alpha.any(axis=0))
+        if len(rows) == 0:
+            self.region = None
+            return
+        self.region = np.s_[rows[0]:rows[-1] + 1, columns[0]:columns[-1] + 1]
+        # Cairo's pixels are premultiplied, so "over" is src + dst (1 - alpha)
+        self.pixels = pixels[self.region].astype(np.uint16)
+        self.transparency = 255 - self.pixels[:, :, 3:]
+
+    def blend_onto(self, frame):
+        if self.region is None:
+            return
+        below = frame[self.region]
+        below[...] = self.pixels + (below * self.transparency + 127) // 255
+
+
+class StatsRenderer(CairoRenderer):
+    """Cairo renderer with static overlays, held-frame encoding and frame counts."""
+
+    def __init__(self, file_writer_class=HoldFileWriter, **kwargs):
+        super().__init__(file_writer_class=file_writer_class, **kwargs)
+        if renditions_setting():
+            # Cached animations are never rasterized, so the renditions
+            # would miss their frames
+            config.disable_caching = True
+        self.frames_rasterized = 0
+        self.frames_emitted = 0
+        # Set by a rasterization until a frame is emitted from it; the
+        # background of an animation and the last frame of a scene are
+        # rasterized without becoming video frames themselves
+        self._rasterized = False
+        self.start_time = time.perf_counter()
+        # Per animation: the moving mobjects and overlays, in drawing order
+        self.layers = None
+        self.layered_mobjects = None
+        self._overlay_buffer = None
+
+    @traced("render", "rasterize frame")
+    def update_frame(self, scene, mobjects=None, *args, **kwargs):
+        self._rasterized = True
+        if self.layers is not None and mobjects is self.layered_mobjects:
+            self.composite_frame()
+            return
+        super().update_frame(scene, mobjects, *args, **kwargs)
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.layers = None
+        if not LAYERS or self.skip_animations:
+            return super().save_static_frame_data(scene, static_mobjects)
+        # Split everything drawn into runs of moving and static mobjects
+        moving = {id(mobject) for mobject in scene.moving_mobjects}
+        runs = []
+        for mobject in extract_mobject_family_members(
+            list_update(scene.mobjects, scene.foreground_mobjects),
+            use_z_index=self.camera.use_z_index,
+            only_those_with_points=True,
+        ):
+            is_moving = id(mobject) in moving
+            if runs and runs[-1][0] == is_moving:
+                runs[-1][1].append(mobject)
+            else:
+                runs.append((is_moving, [mobject]))
+        # The static mobjects under all moving ones are the background,
+        # as in manim
+        background = runs.pop(0)[1] if runs and not runs[0][0] else []
+        super().save_static_frame_data(scene, background)
+        if len(runs) > 1:
+            self.layers = [mobjects if is_moving else self.render_overlay(mobjects) for is_moving, mobjects in runs]
+            self.layered_mobjects = scene.moving_mobjects
+        return self.static_image
+
+    def render_overlay(self, mobjects):
+        camera = self.camera
+        frame = camera.pixel_array
+        # One buffer for all overlays: the camera caches a cairo context
+        # per pixel array, so its identity has to stay the same
+        if self._overlay_buffer is None or self._overlay_buffer.shape != frame.shape:
+            self._overlay_buffer = np.zeros_like(frame)
+        self._overlay_buffer[...] = 0
+        camera.pixel_array = self._overlay_buffer
+        try:
+            # The runs are already flattened families, in drawing order
+            camera.capture_mobjects(mobjects, include_submobjects=False)
+        finally:
+            camera.pixel_array = frame
+        return Overlay(self._overlay_buffer)
+
+    def composite_frame(self):
+        """Draw the moving mobjects of the animation between the prerendered layers."""
+        if self.static_image is not None:
+            self.camera.set_frame_to_background(self.static_image)
+        else:
+            self.camera.reset()
+        for layer in self.layers:
+            if isinstance(layer, Overlay):
+                layer.blend_onto(self.camera.pixel_array)
+            else:
+                self.camera.capture_mobjects(layer, include_submobjects=False)
+
+    def render(self, scene, time, moving_mobjects):
+        self.update_frame(scene, moving_mobjects)
+        if RING_FRAMES and isinstance(self.file_writer, HoldFileWriter):
+            # The file writer copies the frame into its ring
+            self.add_frame(self.camera.pixel_array)
+        else:
+            self.add_frame(self.get_frame())
+
+    def add_frame(self, frame, num_frames=1):
+        if not self.skip_animations:
+            if self._rasterized:
+                self.frames_rasterized += 1
+            self.frames_emitted += num_frames
+        self._rasterized = False
+        super().add_frame(frame, num_frames=num_frames)
+
+    def get_stats(self, scene):
+        seconds = time.perf_counter() - self.start_time
+        ring = getattr(self.file_writer, "ring", None)
+        peak_rss = None
+        if resource is not None:
+            # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+            usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            peak_rss = usage * (1 if sys.platform == "darwin" else 1024)
+        return {
+            "scene": type(scene).__name__,
+            "resolution": [config.pixel_width, config.pixel_height],
+            "plays": self.num_plays,
+            "frames_rasterized": self.frames_rasterized,
+            "frames_emitted": self.frames_emitted,
+            "frames_encoded": getattr(self.file_writer, "frames_encoded", self.frames_emitted),
+            "seconds": round(seconds, 3),
+            "fps": round(self.frames_emitted / seconds, 2),
+            "ring_frames": len(ring.frames) if ring is not None else 0,
+            "ring_waits": ring.waits if ring is not None else 0,
+            "peak_rss_mb": None if peak_rss is None else round(peak_rss / 2**20, 1),
+        }
+
+    @traced("encode", "finish movie")
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        stats = self.get_stats(scene)
+        logger.info(
+            "%(scene)s: %(frames_rasterized)d frames rasterized, %(frames_emitted)d emitted, "
+            "%(frames_encoded)d encoded; %(fps).1f fps, waited for the encoder %(ring_waits)d times, "
+            "peak memory %(peak_rss_mb)s MB",
+            stats,
+        )
+        stats_dir = Path(config.media_dir) / "render_stats"
+        stats_dir.mkdir(parents=True, exist_ok=True)
+        with open(stats_dir / f"{stats['scene']}.json", "w") as f:
+            json.dump(stats, f, indent=2)
@@ -0,0 +1,343 @@
+"""Taylor coefficients of ordinary NumPy functions by jet arithmetic.
+
+A *jet* is a truncated power series ``c_0 + c_1 t + ... + c_N t^N``.
+Evaluating a function on the jet ``a + t`` instead of on a number yields
+the first N + 1 Taylor coefficients of the function around ``a``::
+
+    >>> taylor_coefficients(lambda x: np.exp(x) * np.sin(x), 0.0, 4)
+    array([ 0.        ,  1.        ,  1.        ,  0.33333333,  0.        ])
+
+:class:`Jet` implements the arithmetic operators and the common NumPy
+ufuncs (``np.sin``, ``np.exp``, ``np.log1p``, ``np.arctan``, ...) with the
+usual recurrences, each O(N^2) in the number of terms, so any function
+written with those can be expanded without symbolic algebra.  Jets may
+carry a whole array of centers at once: coefficient ``k`` then is an
+array with the centers' shape, and one evaluation expands the function
+around every center.
+
+:func:`taylor_expansion` wraps the result in a
+:class:`~taylor_polynomial.TaylorPolynomial`, which plots like the
+standard series.
+"""
+import numpy as np
+
+from taylor_polynomial import TaylorPolynomial
+
+
+class Jet:
+    """Truncated power series in ``t`` with ``coefficients[k]`` multiplying ``t^k``."""
+
+    __array_priority__ = 1000
+
+    def __init__(self, coefficients):
+        self.coefficients = np.asarray(coefficients, dtype=np.float64)
+        if self.coefficients.ndim == 0 or len(self.coefficients) == 0:
+            raise ValueError("a jet needs at least one coefficient")
+
+    @classmethod
+    def variable(cls, center, degree):
+        """The jet of ``x`` itself around ``center``: center + t."""
+        center = np.asarray(center, dtype=np.float64)
+        coefficients = np.zeros((degree + 1, *center.shape))
+        coefficients[0] = center
+        if degree:
+            coefficients[1] = 1.0
+        return cls(coefficients)
+
+    @property
+    def degree(self):
+        return len(self.coefficients) - 1
+
+    def _lift(self, value):
+        """``value`` as a coefficient array compatible with this jet."""
+        if isinstance(value, Jet):
+            if value.degree != self.degree:
+                raise ValueError(f"cannot combine jets of degree {self.degree} and {value.degree}")
+            return value.coefficients
+        value = np.asarray(value, dtype=np.float64)
+        coefficients = np.zeros((self.degree + 1, *np.broadcast_shapes(value.shape, self.coefficients.shape[1:])))
+        coefficients[0] = value
+        return coefficients
+
+    # Arithmetic
+
+    def __neg__(self):
+        return Jet(-self.coefficients)
+
+    def __pos__(self):
+        return self
+
+    def __add__(self, other):
+        a, b = _align(self.coefficients, self._lift(other))
+        return Jet(a + b)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        a, b = _align(self.coefficients, self._lift(other))
+        return Jet(a - b)
+
+    def __rsub__(self, other):
+        a, b = _align(self._lift(other), self.coefficients)
+        return Jet(a - b)
+
+    def __mul__(self, other):
+        if not isinstance(other, Jet):
+            a, b = _align(self.coefficients, np.asarray(other, dtype=np.float64)[np.newaxis])
+            return Jet(a * b)
+        return Jet(_multiply(self.coefficients, other.coefficients))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if not isinstance(other, Jet):
+            a, b = _align(self.coefficients, np.asarray(other, dtype=np.float64)[np.newaxis])
+            return Jet(a / b)
+        return Jet(_divide(self.coefficients, self._lift(other)))
+
+    def __rtruediv__(self, other):
+        return Jet(_divide(self._lift(other), self.coefficients))
+
+    def __pow__(self, exponent):
+        if isinstance(exponent, Jet):
+            return np.exp(exponent * np.log(self))
+        if isinstance(exponent, (int, np.integer)) and exponent >= 0:
+            result = Jet(self._lift(1.0))
+            base = self
+            # Square and multiply keeps integer powers exact at a = 0
+            while exponent:
+                if exponent & 1:
+                    result = result * base
+                exponent >>= 1
+                if exponent:
+                    base = base * base
+            return result
+        return Jet(_power(self.coefficients, float(exponent)))
+
+    def __rpow__(self, base):
+        return np.exp(self * np.log(base))
+
+    # NumPy integration
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        if ufunc in _BINARY:
+            return _BINARY[ufunc](*inputs)
+        if ufunc in _UNARY and len(inputs) == 1:
+            return Jet(_UNARY[ufunc](inputs[0].coefficients))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Jet(degree={self.degree}, value={self.coefficients[0]!r})"
+
+
+# Recurrences on coefficient arrays.  Each takes and returns arrays of
+# shape (N + 1, *batch) and costs O(N^2) elementwise operations.
+
+def _align(a, b):
+    """Give two coefficient arrays the same number of batch dimensions."""
+    ndim = max(a.ndim, b.ndim)
+    return (
+        a.reshape(a.shape[:1] + (1,) * (ndim - a.ndim) + a.shape[1:]),
+        b.reshape(b.shape[:1] + (1,) * (ndim - b.ndim) + b.shape[1:]),
+    )
+
+
+def _multiply(a, b):
+    a, b = _align(a, b)
+    c = np.zeros(np.broadcast_shapes(a.shape, b.shape))
+    for k in range(len(c)):
+        c[k] = np.sum(a[:k + 1] * b[k::-1], axis=0)
+    return c
+
+
+def _divide(a, b):
+    """Coefficients of a / b, from b * c = a solved term by term."""
+    a, b = _align(a, b)
+    shape = np.broadcast_shapes(a.shape, b.shape)
+    a = np.broadcast_to(a, shape)
+    c = np.zeros(shape)
+    for k in range(len(c)):
+        c[k] = (a[k] - np.sum(b[1:k + 1] * c[k - 1::-1][:k], axis=0)) / b[0]
+    return c
+
+
+def _derivative(a):
+    """Coefficients of da/dt, padded back to the same length."""
+    k = np.arange(1, len(a)).reshape(-1, *([1] * (a.ndim - 1)))
+    d = np.zeros_like(a)
+    d[:-1] = a[1:] * k
+    return d
+
+
+def _integral(d, constant):
+    """Coefficients of the antiderivative of ``d`` with the given constant term."""
+    k = np.arange(1, len(d)).reshape(-1, *([1] * (d.ndim - 1)))
+    c = np.empty_like(d)
+    c[0] = constant
+    c[1:] = d[:-1] / k
+    return c
+
+
+def _exp(a):
+    # e' = a' e  =>  k e_k = sum_j j a_j e_(k-j)
+    e = np.zeros_like(a)
+    e[0] = np.exp(a[0])
+    j = np.arange(1, len(a)).reshape(-1, *([1] * (a.ndim - 1)))
+    for k in range(1, len(a)):
+        e[k] = np.sum(j[:k] * a[1:k + 1] * e[k - 1::-1][:k], axis=0) / k
+    return e
+
+
+def _log(a):
+    # l' = a' / a
+    return _integral(_divide(_derivative(a), a), np.log(a[0]))
+
+
+def _power(a, p):
+    # w = a^p  =>  a w' = p a' w  =>  k a_0 w_k = sum_j ((p + 1) j - k) a_j w_(k-j)
+    w = np.zeros_like(a)
+    w[0] = a[0] ** p
+    for k in range(1, len(a)):
+        j = np.arange(1, k + 1).reshape(-1, *([1] * (a.ndim - 1)))
+        w[k] = np.sum(((p + 1) * j - k) * a[1:k + 1] * w[k - 1::-1][:k], axis=0) / (k * a[0])
+    return w
+
+
+def _sin_cos(a, sign):
+    """Coefficients of (sin a, cos a), or (sinh a, cosh a) with ``sign`` +1."""
+    s = np.zeros_like(a)
+    c = np.zeros_like(a)
+    if sign < 0:
+        s[0], c[0] = np.sin(a[0]), np.cos(a[0])
+    else:
+        s[0], c[0] = np.sinh(a[0]), np.cosh(a[0])
+    j = np.arange(1, len(a)).reshape(-1, *([1] * (a.ndim - 1)))
+    for k in range(1, len(a)):
+        ja = j[:k] * a[1:k + 1]
+        s[k] = np.sum(ja * c[k - 1::-1][:k], axis=0) / k
+        c[k] = sign * np.sum(ja * s[k - 1::-1][:k], axis=0) / k
+    return s, c
+
+
+def _arctan(a):
+    # atan' = a' / (1 + a^2)
+    return _integral(_divide(_derivative(a), _one_plus(_multiply(a, a))), np.arctan(a[0]))
+
+
+def _arcsin(a):
+    # asin' = a' / sqrt(1 - a^2)
+    return _integral(_divide(_derivative(a), _power(_one_plus(-_multiply(a, a)), 0.5)), np.arcsin(a[0]))
+
+
+def _arctanh(a):
+    # atanh' = a' / (1 - a^2)
+    return _integral(_divide(_derivative(a), _one_plus(-_multiply(a, a))), np.arctanh(a[0]))
+
+
+def _one_plus(a):
+    b = a.copy()
+    b[0] += 1
+    return b
+
+
+def _expm1(a):
+    e = _exp(a)
+    e[0] = np.expm1(a[0])
+    return e
+
+
+def _log1p(a):
+    l = _log(_one_plus(a))
+    l[0] = np.log1p(a[0])
+    return l
+
+
+def _tan(a):
+    s, c = _sin_cos(a, -1)
+    return _divide(s, c)
+
+
+def _tanh(a):
+    s, c = _sin_cos(a, 1)
+    return _divide(s, c)
+
+
+def _lift_one(a):
+    one = np.zeros_like(a)
+    one[0] = 1
+    return one
+
+
+def _arccos(a):
+    c = -_arcsin(a)
+    c[0] = np.arccos(a[0])
+    return c
+
+
+_UNARY = {
+    np.negative: np.negative,
+    np.positive: np.copy,
+    np.exp: _exp,
+    np.expm1: _expm1,
+    np.log: _log,
+    np.log1p: _log1p,
+    np.sqrt: lambda a: _power(a, 0.5),
+    np.cbrt: lambda a: _power(a, 1 / 3),
+    np.square: lambda a: _multiply(a, a),
+    np.reciprocal: lambda a: _divide(_lift_one(a), a),
+    np.sin: lambda a: _sin_cos(a, -1)[0],
+    np.cos: lambda a: _sin_cos(a, -1)[1],
+    np.tan: _tan,
+    np.sinh: lambda a: _sin_cos(a, 1)[0],
+    np.cosh: lambda a: _sin_cos(a, 1)[1],
+    np.tanh: _tanh,
+    np.arctan: _arctan,
+    np.arcsin: _arcsin,
+    np.arccos: _arccos,
+    np.arctanh: _arctanh,
+}
+
+
+def _jet_operands(x, y):
+    jet = x if isinstance(x, Jet) else y
+    return jet, x, y
+
+
+def _binary(operator):
+    def apply(x, y):
+        jet, x, y = _jet_operands(x, y)
+        return operator(x if isinstance(x, Jet) else Jet(jet._lift(x)), y)
+    return apply
+
+
+_BINARY = {
+    np.add: _binary(lambda x, y: x + y),
+    np.subtract: _binary(lambda x, y: x - y),
+    np.multiply: _binary(lambda x, y: x * y),
+    np.divide: _binary(lambda x, y: x / y),
+    np.power: _binary(lambda x, y: x ** y),
+}
+
+
+def taylor_coefficients(f, center, degree):
+    """First ``degree + 1`` Taylor coefficients of ``f`` around ``center``.
+
+    ``f`` is an ordinary function of one variable built from arithmetic
+    and the NumPy ufuncs :class:`Jet` supports.  ``center`` may be an
+    array, in which case the result has shape ``(degree + 1, *center.shape)``
+    (or larger, if ``f`` itself returns an array per center).
+    """
+    x = Jet.variable(center, degree)
+    result = f(x)
+    if not isinstance(result, Jet):
+        # f ignored its argument, e.g. lambda x: 2.0
+        return x._lift(result)
+    coefficients, variable = _align(result.coefficients, x.coefficients)
+    return np.broadcast_to(coefficients, np.broadcast_shapes(coefficients.shape, variable.shape)).copy()
+
+
+def taylor_expansion(f, center, degree):
+    """Taylor polynomial of degree ``degree`` of ``f`` around a scalar ``center``."""
+    return TaylorPolynomial(taylor_coefficients(f, float(center), degree), center)
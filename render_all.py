@@ -0,0 +1,276 @@
+"""Render every scene of an animation script in parallel.
+
+``manim -a`` renders the scenes of a file one after another on a single
+core.  This driver finds the Scene subclasses defined in the script and
+renders each one in its own ``manim`` process, several at a time,
+longest first by the estimates of :mod:`scene_manifest`, then reports
+the wall time and exit status of every scene.
+
+On small machines, where a process per scene does not pay off,
+``--pipeline`` renders the scenes one after another in this process
+instead, but prepares the next ``--lookahead`` scenes in a background
+thread while the current one is rasterized and encoded: their formulas
+are typeset and loaded, and their curves sampled (see
+:meth:`~taylor_scene.TaylorScene.prepare`), so the LaTeX runs overlap
+with rendering.  Each scene holds its frame buffers and mobjects, so at
+most ``--lookahead`` + 1 scenes are in memory at once: the one rendering
+and those prepared ahead of it.
+
+``--renditions`` publishes several resolutions from one render per
+scene: the scenes are rendered at the quality of the largest rendition
+and the others are encoded from the same frames (see
+``TAYLOR_RENDITIONS`` in :mod:`frame_writer`).
+
+Usage::
+
+    python render_all.py taylor_series_hq.py -q h -j 8
+    python render_all.py taylor_series_animation.py SineExample CosineExample -- --disable_caching
+    python render_all.py taylor_series_hq.py -q l --pipeline
+    python render_all.py taylor_series_hq.py --renditions 480p15,720p30,1080p60
+    python render_all.py taylor_series_hq.py -q l --profile draft
+"""
+import argparse
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from render_profiles import PROFILES, current_profile
+from scene_manifest import load_scenes
+
+
+QUALITIES = ["l", "m", "h", "p", "k"]
+# Frame height and rate of manim's quality flags
+QUALITY_FORMATS = {"l": (480, 15), "m": (720, 30), "h": (1080, 60), "p": (1440, 60), "k": (2160, 60)}
+
+
+def find_scenes(script):
+    """Names of the Scene subclasses defined in ``script``, in source order.
+
+    Read from the static scene index (see scene_manifest.py), without
+    importing manim or the script.
+    """
+    return [scene["name"] for scene in load_scenes(script)]
+
+
+def _load_script(script):
+    script = Path(script)
+    spec = importlib.util.spec_from_file_location(script.stem, script)
+    module = importlib.util.module_from_spec(spec)
+    sys.path.insert(0, str(script.parent.resolve()))
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.pop(0)
+    return module
+
+
+def render_scene(script, scene, quality, manim_args, log_dir):
+    """Render one scene in a separate manim process.
+
+    Returns a dict with the scene name, exit status, wall time in seconds
+    and the path of the log holding manim's output.
+    """
+    command = [sys.executable, "-m", "manim", "render", f"-q{quality}", *manim_args, str(script), scene]
+    log_path = Path(log_dir) / f"{scene}.log"
+    start = time.perf_counter()
+    with open(log_path, "w") as log:
+        returncode = subprocess.call(command, stdout=log, stderr=subprocess.STDOUT)
+    return {
+        "scene": scene,
+        "returncode": returncode,
+        "seconds": round(time.perf_counter() - start, 3),
+        "log": str(log_path),
+    }
+
+
+def render_all(script, scenes, quality="h", jobs=None, manim_args=(), log_dir="media/render_logs"):
+    """Render ``scenes`` of ``script`` with up to ``jobs`` manim processes.
+
+    Results are returned in the order the scenes finish.
+    """
+    Path(log_dir).mkdir(parents=True, exist_ok=True)
+    jobs = jobs or os.cpu_count() or 1
+    # Start the longest scenes first, so none is left running alone at the
+    # end; the manifest's waits are those of the final profile
+    wait_scale = current_profile()["wait_scale"]
+    durations = {
+        scene["name"]: scene["play_seconds"] + scene["wait_seconds"] * wait_scale for scene in load_scenes(script)
+    }
+    scenes = sorted(scenes, key=lambda scene: durations.get(scene, 0), reverse=True)
+    results = []
+    # Each worker thread only waits on its manim subprocess, so threads are
+    # enough to keep `jobs` processes busy
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(render_scene, script, scene, quality, list(manim_args), log_dir)
+            for scene in scenes
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            status = "ok" if result["returncode"] == 0 else f"FAILED ({result['returncode']})"
+            print(f"{result['scene']:<28} {result['seconds']:>8.1f}s  {status}", flush=True)
+            results.append(result)
+    return results
+
+
+def render_pipelined(script, scenes, quality="h", lookahead=1, profile=None, renditions=None):
+    """Render ``scenes`` of ``script`` in this process, preparing up to ``lookahead`` ahead.
+
+    ``profile`` selects the render profile (see render_profiles.py) and
+    ``renditions`` the extra renditions to encode (see ``TAYLOR_RENDITIONS``
+    in :mod:`frame_writer`) for this process, as the environment variables
+    do for manim's.  Scenes without a ``prepare`` method are simply
+    rendered in turn.  Results are returned in scene order; a scene's
+    ``log`` is ``None``, as manim's output goes to this process's console.
+    """
+    from manim import config, logger
+    from manim.constants import QUALITIES as MANIM_QUALITIES
+
+    if profile is not None:
+        os.environ["TAYLOR_PROFILE"] = profile
+    if renditions is not None:
+        os.environ["TAYLOR_RENDITIONS"] = renditions
+    # Configure the run as `manim -q<quality> <script>` would, before the
+    # script's own module-level settings are applied
+    config.quality = next(name for name, value in MANIM_QUALITIES.items() if value["flag"] == quality)
+    config.input_file = str(Path(script).resolve())
+    module = _load_script(script)
+
+    results = []
+    upcoming = iter(scenes)
+    # (scene name, scene or exception, future of its preparation)
+    prepared = deque()
+    with ThreadPoolExecutor(max_workers=1) as worker:
+        while True:
+            # The next scene, unless it was prepared ahead
+            _prepare_ahead(module, upcoming, prepared, worker, 1)
+            if not prepared:
+                break
+            name, scene, future = prepared.popleft()
+            # The scenes after this one, prepared while it renders
+            _prepare_ahead(module, upcoming, prepared, worker, lookahead)
+            start = time.perf_counter()
+            returncode = 0
+            try:
+                if isinstance(scene, Exception):
+                    raise scene
+                if future is not None:
+                    future.result()
+                scene.render()
+            except Exception:
+                logger.exception(f"{name} failed")
+                returncode = 1
+            result = {
+                "scene": name,
+                "returncode": returncode,
+                "seconds": round(time.perf_counter() - start, 3),
+                "log": None,
+            }
+            status = "ok" if returncode == 0 else "FAILED"
+            print(f"{name:<28} {result['seconds']:>8.1f}s  {status}", flush=True)
+            results.append(result)
+            # Let the scene go before the next one is built
+            del scene, future
+    return results
+
+
+def _prepare_ahead(module, upcoming, prepared, worker, size):
+    """Instantiate scenes from ``upcoming`` until ``size`` are queued in ``prepared``."""
+    while len(prepared) < size:
+        name = next(upcoming, None)
+        if name is None:
+            return
+        try:
+            scene = getattr(module, name)()
+        except Exception as error:
+            prepared.append((name, error, None))
+            continue
+        future = worker.submit(scene.prepare) if hasattr(scene, "prepare") else None
+        prepared.append((name, scene, future))
+
+
+def _split_renditions(setting, parser):
+    """Quality flag to render ``setting`` at, and the renditions left to encode from it."""
+    from frame_writer import parse_renditions
+
+    try:
+        renditions = parse_renditions(setting)
+    except ValueError as error:
+        parser.error(str(error))
+    if not renditions:
+        parser.error("--renditions is empty")
+    height = max(rendition_height for rendition_height, _, _ in renditions)
+    quality = next((flag for flag, (quality_height, _) in QUALITY_FORMATS.items() if quality_height >= height), None)
+    if quality is None:
+        parser.error(f"no manim quality renders {height}p")
+    # The render itself is the rendition matching its quality
+    main_format = QUALITY_FORMATS[quality]
+    entries = [entry.strip() for entry in setting.split(",") if entry.strip()]
+    others = [
+        entry for entry, (rendition_height, frame_rate, extension) in zip(entries, renditions)
+        if (rendition_height, frame_rate or main_format[1], extension) != (*main_format, ".mp4")
+    ]
+    return quality, ",".join(others)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    manim_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, manim_args = argv[:split], argv[split + 1:]
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("script", help="animation script, e.g. taylor_series_hq.py")
+    parser.add_argument("scenes", nargs="*", help="scenes to render (default: all)")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h", help="manim quality flag")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="parallel manim processes (default: CPU count)")
+    parser.add_argument("--log-dir", default="media/render_logs", help="where per-scene manim output is written")
+    parser.add_argument("--json", help="write the per-scene results to this JSON file")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="render in this process, preparing the next scenes while one renders")
+    parser.add_argument("--lookahead", type=int, default=1,
+                        help="scenes prepared ahead of the one rendering with --pipeline (default: 1)")
+    parser.add_argument("--profile", choices=list(PROFILES),
+                        help="render profile, see render_profiles.py (default: TAYLOR_PROFILE or final)")
+    parser.add_argument("--renditions",
+                        help="resolutions to publish from one render, e.g. 480p15,720p30,1080p60 (overrides -q)")
+    args = parser.parse_args(argv)
+    if args.pipeline and manim_args:
+        parser.error("manim arguments after -- cannot be used with --pipeline")
+    if args.lookahead < 0:
+        parser.error("--lookahead must not be negative")
+    if args.profile:
+        os.environ["TAYLOR_PROFILE"] = args.profile
+    renditions = None
+    if args.renditions:
+        args.quality, renditions = _split_renditions(args.renditions, parser)
+        os.environ["TAYLOR_RENDITIONS"] = renditions
+
+    scenes = args.scenes or find_scenes(args.script)
+    start = time.perf_counter()
+    if args.pipeline:
+        results = render_pipelined(args.script, scenes, args.quality, args.lookahead, args.profile, renditions)
+    else:
+        results = render_all(args.script, scenes, args.quality, args.jobs, manim_args, args.log_dir)
+    total = time.perf_counter() - start
+
+    failed = [result["scene"] for result in results if result["returncode"] != 0]
+    print(f"\n{len(results) - len(failed)}/{len(results)} scenes rendered in {total:.1f}s")
+    if failed:
+        print("Failed: " + ", ".join(failed) + ("" if args.pipeline else f" (see {args.log_dir})"))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"script": args.script, "quality": args.quality, "seconds": round(total, 3),
+                       "scenes": results}, f, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
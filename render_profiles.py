@@ -0,0 +1,74 @@
+"""Named render profiles trading visual detail for render time.
+
+``TAYLOR_PROFILE`` selects one of :data:`PROFILES` for the run (``final``
+by default); it is read each time a setting is used, through
+:func:`current_profile`, so a driver can set it after importing the
+scenes::
+
+    TAYLOR_PROFILE=draft manim -ql taylor_series_hq.py SineExample
+
+A profile scales everything that makes a frame expensive together:
+
+``pixel_tolerance``
+    how far, in pixels, plotted curves may deviate from the true graph;
+    the sample density of every curve follows from it
+``smoothing``
+    whether curves drawn without exact slopes are smoothed
+``stroke_scale``
+    factor on the stroke width of plotted curves
+``label_backgrounds``
+    whether labels get their background rectangles
+``wait_scale``
+    factor on every ``self.wait`` duration
+
+Resolution and frame rate stay with manim's ``-q`` flag, so ``draft``
+pairs with ``-ql`` for previews and ``final`` with ``-qh`` or ``-qk``.
+"""
+import os
+
+
+PROFILES = {
+    "draft": {
+        "pixel_tolerance": 2.0,
+        "smoothing": False,
+        "stroke_scale": 0.6,
+        "label_backgrounds": False,
+        "wait_scale": 0.25,
+    },
+    "review": {
+        "pixel_tolerance": 1.0,
+        "smoothing": True,
+        "stroke_scale": 0.8,
+        "label_backgrounds": True,
+        "wait_scale": 0.5,
+    },
+    "final": {
+        "pixel_tolerance": 0.5,
+        "smoothing": True,
+        "stroke_scale": 1.0,
+        "label_backgrounds": True,
+        "wait_scale": 1.0,
+    },
+}
+
+
+def current_profile():
+    """The settings of the profile ``TAYLOR_PROFILE`` selects."""
+    name = os.environ.get("TAYLOR_PROFILE", "").lower() or "final"
+    if name not in PROFILES:
+        raise ValueError(f"unknown TAYLOR_PROFILE {name!r}, expected one of {', '.join(PROFILES)}")
+    return PROFILES[name]
+
+
+def curve_style(kwargs):
+    """``VMobject`` keyword arguments of a plotted curve, with the profile's stroke width."""
+    if "stroke_width" in kwargs:
+        kwargs = {**kwargs, "stroke_width": kwargs["stroke_width"] * current_profile()["stroke_scale"]}
+    return kwargs
+
+
+def add_background_rectangle(mobject, **kwargs):
+    """``mobject.add_background_rectangle(**kwargs)``, unless the profile leaves label backgrounds out."""
+    if current_profile()["label_backgrounds"]:
+        mobject.add_background_rectangle(**kwargs)
+    return mobject
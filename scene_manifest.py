@@ -0,0 +1,601 @@
+"""Static index of the scenes in the animation scripts, without importing manim.
+
+Listing scenes by importing a script pulls in manim, which takes seconds.
+:func:`load_scenes` instead parses the script with :mod:`ast`, finds the
+classes deriving from a ``...Scene`` base (following imports of the
+project's own modules, e.g. to :class:`~taylor_examples.TaylorExampleScene`)
+and estimates each scene's duration by walking its ``construct``: every
+``self.play`` counts its ``run_time`` (1 second by default) and every
+``self.wait`` its duration.  Helper methods of the scene are followed,
+and loops, conditions and spec lookups are worked out where their values
+are literals, so spec-driven example scenes get exact estimates too;
+anything that cannot be worked out marks the estimate as approximate.
+Durations are those of the ``final`` profile; ``wait_seconds`` scales
+with a profile's ``wait_scale``.
+
+The index is cached in ``media/scene_manifest.json`` and rebuilt for a
+script only when the script or one of the project modules it was built
+from changes.  From the command line::
+
+    python scene_manifest.py
+    python scene_manifest.py taylor_series_hq.py --filter Example --json
+"""
+import argparse
+import ast
+import json
+import os
+import sys
+from pathlib import Path
+
+
+SCRIPTS = ["taylor_series_hq.py", "taylor_series_animation.py"]
+CACHE_PATH = Path("media") / "scene_manifest.json"
+CACHE_VERSION = 2
+
+# manim's defaults for calls that do not say
+DEFAULT_RUN_TIME = 1.0
+DEFAULT_WAIT_TIME = 1.0
+
+# Mobject groups, which iterate over and count their members like lists
+GROUP_CLASSES = {"Group", "VGroup"}
+
+# Longest loop unrolled when estimating, and deepest chain of helper calls
+MAX_ITERATIONS = 10000
+MAX_DEPTH = 20
+
+
+class _Unknown:
+    """A value the scan cannot work out; neither truthy nor falsy."""
+
+    def __repr__(self):
+        return "?"
+
+
+class _Opaque:
+    """Some object the scan does not model, such as a mobject; always truthy."""
+
+    def __repr__(self):
+        return "<object>"
+
+
+UNKNOWN = _Unknown()
+OPAQUE = _Opaque()
+
+
+def load_scenes(script, cache_path=CACHE_PATH):
+    """Index entries of the scenes in ``script``, from the cache when it is current."""
+    key = str(Path(script).resolve())
+    cache = _read_cache(cache_path) if cache_path else {}
+    entry = cache.get(key)
+    if entry is None or not _sources_current(entry["sources"]):
+        scanner = _Scanner()
+        entry = {"scenes": scanner.scan(script), "sources": _stat_sources(scanner.modules)}
+        if cache_path:
+            cache[key] = entry
+            _write_cache(cache_path, cache)
+    return entry["scenes"]
+
+
+def _read_cache(cache_path):
+    try:
+        with open(cache_path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data.get("scripts", {}) if data.get("version") == CACHE_VERSION else {}
+
+
+def _write_cache(cache_path, cache):
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump({"version": CACHE_VERSION, "scripts": cache}, f, indent=1)
+    os.replace(tmp_path, cache_path)
+
+
+def _stat_sources(paths):
+    sources = {}
+    for path in paths:
+        stat = os.stat(path)
+        sources[str(path)] = [stat.st_mtime_ns, stat.st_size]
+    return sources
+
+
+def _sources_current(sources):
+    try:
+        return all(
+            [stat.st_mtime_ns, stat.st_size] == recorded
+            for stat, recorded in ((os.stat(path), recorded) for path, recorded in sources.items())
+        )
+    except OSError:
+        return False
+
+
+class _Module:
+    """Top-level classes, assignments and imports of one source file."""
+
+    def __init__(self, path):
+        self.path = Path(path).resolve()
+        tree = ast.parse(self.path.read_text(encoding="utf-8"), str(self.path))
+        self.classes = {}
+        self.assignments = {}
+        self.imports = {}
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                self.classes[node.name] = node
+            elif isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                self.assignments[node.targets[0].id] = node.value
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                for alias in node.names:
+                    if alias.name != "*":
+                        self.imports[alias.asname or alias.name] = (node.module, alias.name)
+
+
+class _Class:
+    def __init__(self, module, node):
+        self.module = module
+        self.node = node
+
+
+class _Scanner:
+    """Parses a script and the project modules it imports, and times its scenes."""
+
+    def __init__(self):
+        # Parsed modules by path, and module-level values already evaluated
+        self.modules = {}
+        self._globals = {}
+
+    def module(self, path):
+        path = Path(path).resolve()
+        if path not in self.modules:
+            self.modules[path] = _Module(path)
+        return self.modules[path]
+
+    def scan(self, script):
+        module = self.module(script)
+        scenes = []
+        for name, node in module.classes.items():
+            cls = _Class(module, node)
+            if not self.is_scene(cls):
+                continue
+            timing = _Timing()
+            construct = self.find_method(cls, "construct")
+            if construct is not None:
+                _Frame(self, cls, construct[0], {}).run(construct[1].body, timing)
+            scenes.append({
+                "name": name,
+                "line": node.lineno,
+                "bases": [ast.unparse(base) for base in node.bases],
+                "doc": (ast.get_docstring(node) or "").strip().split("\n")[0],
+                "duration": round(timing.play_seconds + timing.wait_seconds, 3),
+                "play_seconds": round(timing.play_seconds, 3),
+                "wait_seconds": round(timing.wait_seconds, 3),
+                "plays": timing.plays,
+                "waits": timing.waits,
+                "exact": timing.exact,
+            })
+        return scenes
+
+    def resolve(self, module, name):
+        """The class or value ``name`` refers to at the top level of ``module``."""
+        if name in module.classes:
+            return _Class(module, module.classes[name])
+        if name in module.assignments:
+            key = (module.path, name)
+            if key not in self._globals:
+                # Guards against self-referencing definitions
+                self._globals[key] = UNKNOWN
+                self._globals[key] = _Frame(self, None, module, {}).evaluate(module.assignments[name])
+            return self._globals[key]
+        if name in module.imports:
+            module_name, attribute = module.imports[name]
+            path = module.path.parent / (module_name.replace(".", os.sep) + ".py")
+            if path.exists():
+                return self.resolve(self.module(path), attribute)
+        return OPAQUE
+
+    def bases(self, cls):
+        """Base classes of ``cls``: ``_Class`` when defined in the project, names otherwise."""
+        result = []
+        for base in cls.node.bases:
+            resolved = self.resolve(cls.module, base.id) if isinstance(base, ast.Name) else None
+            result.append(resolved if isinstance(resolved, _Class) else ast.unparse(base))
+        return result
+
+    def mro(self, cls):
+        """``cls`` and its project base classes, depth first."""
+        order = [cls]
+        for base in self.bases(cls):
+            if isinstance(base, _Class):
+                for ancestor in self.mro(base):
+                    if all(ancestor.node is not known.node for known in order):
+                        order.append(ancestor)
+        return order
+
+    def is_scene(self, cls):
+        """Whether ``cls`` derives from a class named ``...Scene``."""
+        ancestors = self.mro(cls)
+        names = [ancestor.node.name for ancestor in ancestors[1:]]
+        for ancestor in ancestors:
+            names.extend(base for base in self.bases(ancestor) if isinstance(base, str))
+        return any(name.endswith("Scene") for name in names)
+
+    def find_method(self, cls, name):
+        """``(module, FunctionDef)`` of method ``name`` of ``cls``, if defined in the project."""
+        for ancestor in self.mro(cls):
+            for node in ancestor.node.body:
+                if isinstance(node, ast.FunctionDef) and node.name == name:
+                    return ancestor.module, node
+        return None
+
+    def class_attribute(self, cls, name):
+        for ancestor in self.mro(cls):
+            for node in ancestor.node.body:
+                if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                        and isinstance(node.targets[0], ast.Name) and node.targets[0].id == name):
+                    return _Frame(self, None, ancestor.module, {}).evaluate(node.value)
+        return OPAQUE
+
+
+class _Timing:
+    def __init__(self):
+        self.play_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.plays = 0
+        self.waits = 0
+        self.exact = True
+
+    def add(self, other, times=1):
+        self.play_seconds += other.play_seconds * times
+        self.wait_seconds += other.wait_seconds * times
+        self.plays += other.plays * times
+        self.waits += other.waits * times
+        self.exact = self.exact and other.exact
+
+
+class _Return(Exception):
+    pass
+
+
+class _Frame:
+    """Evaluates the statements of one method of a scene, with its local variables."""
+
+    def __init__(self, scanner, scene, module, env, depth=0):
+        self.scanner = scanner
+        self.scene = scene
+        self.module = module
+        self.env = env
+        self.depth = depth
+
+    # Statements
+
+    def run(self, statements, timing):
+        """Add the time ``statements`` take to ``timing``; returns ``False`` after a ``return``."""
+        for statement in statements:
+            if isinstance(statement, ast.Expr):
+                self.evaluate(statement.value, timing)
+            elif isinstance(statement, ast.Assign):
+                value = self.evaluate(statement.value, timing)
+                for target in statement.targets:
+                    self.bind(target, value)
+            elif isinstance(statement, (ast.AugAssign, ast.AnnAssign)):
+                if statement.value is not None:
+                    self.evaluate(statement.value, timing)
+                self.bind(statement.target, UNKNOWN)
+            elif isinstance(statement, ast.If):
+                if not self.run_if(statement, timing):
+                    return False
+            elif isinstance(statement, ast.For):
+                self.run_for(statement, timing)
+            elif isinstance(statement, ast.While):
+                # Runs at least once as far as the estimate knows
+                timing.exact = False
+                self.run(statement.body, timing)
+            elif isinstance(statement, (ast.With, ast.Try)):
+                if not self.run(statement.body, timing):
+                    return False
+            elif isinstance(statement, ast.Return):
+                if statement.value is not None:
+                    self.env["<return>"] = self.evaluate(statement.value, timing)
+                return False
+        return True
+
+    def run_if(self, statement, timing):
+        test = self.evaluate(statement.test, timing)
+        if test is UNKNOWN:
+            # Either branch may run: count the longer one
+            branches = []
+            for body in (statement.body, statement.orelse):
+                branch = _Timing()
+                _Frame(self.scanner, self.scene, self.module, dict(self.env), self.depth).run(body, branch)
+                branches.append(branch)
+            longer = max(branches, key=lambda branch: branch.play_seconds + branch.wait_seconds)
+            timing.add(longer)
+            timing.exact = False
+            return True
+        return self.run(statement.body if test else statement.orelse, timing)
+
+    def run_for(self, statement, timing):
+        items = self.evaluate(statement.iter, timing)
+        if not isinstance(items, list) or len(items) > MAX_ITERATIONS:
+            timing.exact = False
+            self.bind(statement.target, UNKNOWN)
+            self.run(statement.body, timing)
+            return
+        for item in items:
+            self.bind(statement.target, item)
+            self.run(statement.body, timing)
+
+    def bind(self, target, value):
+        if isinstance(target, ast.Name):
+            self.env[target.id] = value
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            values = value if isinstance(value, (list, tuple)) and len(value) == len(target.elts) else None
+            for index, element in enumerate(target.elts):
+                self.bind(element, UNKNOWN if values is None else values[index])
+
+    # Expressions
+
+    def evaluate(self, node, timing=None):
+        """The value of ``node``, adding the time of any scene calls in it to ``timing``."""
+        timing = timing if timing is not None else _Timing()
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.Name):
+            if node.id in self.env:
+                return self.env[node.id]
+            return self.scanner.resolve(self.module, node.id)
+        if isinstance(node, ast.Attribute):
+            if isinstance(node.value, ast.Name) and node.value.id == "self" and self.scene is not None:
+                return self.scanner.class_attribute(self.scene, node.attr)
+            owner = self.evaluate(node.value, timing)
+            if isinstance(owner, _Class):
+                return self.scanner.class_attribute(owner, node.attr)
+            return OPAQUE
+        if isinstance(node, ast.Subscript):
+            container = self.evaluate(node.value, timing)
+            key = self.evaluate(node.slice, timing)
+            if container is UNKNOWN or key is UNKNOWN:
+                return UNKNOWN
+            try:
+                return container[key] if isinstance(container, (dict, list, tuple, str)) else OPAQUE
+            except (KeyError, IndexError, TypeError):
+                return UNKNOWN
+        if isinstance(node, ast.Dict):
+            result = {}
+            for key, value in zip(node.keys, node.values):
+                value = self.evaluate(value, timing)
+                if key is None:
+                    if isinstance(value, dict):
+                        result.update(value)
+                else:
+                    key = self.evaluate(key, timing)
+                    if isinstance(key, (str, int, float, bool, type(None))):
+                        result[key] = value
+            return result
+        if isinstance(node, (ast.List, ast.Tuple)):
+            return [self.evaluate(element, timing) for element in node.elts]
+        if isinstance(node, ast.BinOp):
+            return _arithmetic(node.op, self.evaluate(node.left, timing), self.evaluate(node.right, timing))
+        if isinstance(node, ast.UnaryOp):
+            operand = self.evaluate(node.operand, timing)
+            if isinstance(node.op, ast.Not):
+                return UNKNOWN if operand is UNKNOWN else not operand
+            if isinstance(node.op, ast.USub) and _is_number(operand):
+                return -operand
+            return UNKNOWN
+        if isinstance(node, ast.BoolOp):
+            values = [self.evaluate(value, timing) for value in node.values]
+            if any(value is UNKNOWN for value in values):
+                return UNKNOWN
+            return all(values) if isinstance(node.op, ast.And) else any(values)
+        if isinstance(node, ast.Compare):
+            values = [self.evaluate(value, timing) for value in [node.left, *node.comparators]]
+            return _comparison(node.ops, values)
+        if isinstance(node, ast.Call):
+            return self.call(node, timing)
+        return OPAQUE
+
+    def call(self, node, timing):
+        function = node.func
+        if isinstance(function, ast.Attribute) and isinstance(function.value, ast.Name) \
+                and function.value.id == "self" and self.scene is not None:
+            return self.call_method(function.attr, node, timing)
+        arguments = []
+        for argument in node.args:
+            if isinstance(argument, ast.Starred):
+                value = self.evaluate(argument.value, timing)
+                if not isinstance(value, list):
+                    arguments = UNKNOWN
+                    continue
+                if arguments is not UNKNOWN:
+                    arguments.extend(value)
+            elif arguments is UNKNOWN:
+                self.evaluate(argument, timing)
+            else:
+                arguments.append(self.evaluate(argument, timing))
+        for keyword in node.keywords:
+            self.evaluate(keyword.value, timing)
+        if isinstance(function, ast.Name) and function.id in GROUP_CLASSES:
+            return arguments
+        if arguments is UNKNOWN:
+            return OPAQUE
+        if isinstance(function, ast.Name) and function.id in ("len", "range", "zip", "enumerate"):
+            return _builtin(function.id, arguments)
+        if isinstance(function, ast.Attribute) and function.attr in ("get", "add"):
+            owner = self.evaluate(function.value, timing)
+            if function.attr == "get" and isinstance(owner, dict) and arguments:
+                return owner.get(arguments[0], arguments[1] if len(arguments) > 1 else None)
+            if function.attr == "add" and isinstance(owner, list):
+                owner.extend(arguments)
+                return owner
+        return OPAQUE
+
+    def call_method(self, name, node, timing):
+        if name == "play":
+            for argument in node.args:
+                self.evaluate(argument, timing)
+            run_time = next((keyword.value for keyword in node.keywords if keyword.arg == "run_time"), None)
+            seconds = DEFAULT_RUN_TIME if run_time is None else self.evaluate(run_time, timing)
+            if not _is_number(seconds):
+                seconds = DEFAULT_RUN_TIME
+                timing.exact = False
+            timing.play_seconds += seconds
+            timing.plays += 1
+            return None
+        if name == "wait":
+            duration = node.args[0] if node.args else next(
+                (keyword.value for keyword in node.keywords if keyword.arg == "duration"), None
+            )
+            seconds = DEFAULT_WAIT_TIME if duration is None else self.evaluate(duration, timing)
+            if not _is_number(seconds):
+                seconds = DEFAULT_WAIT_TIME
+                timing.exact = False
+            timing.wait_seconds += seconds
+            timing.waits += 1
+            return None
+
+        method = self.scanner.find_method(self.scene, name)
+        if method is None or self.depth >= MAX_DEPTH:
+            for argument in node.args:
+                self.evaluate(argument, timing)
+            return OPAQUE
+        module, definition = method
+        # Bind the arguments to the helper's parameters, skipping self
+        env = {}
+        parameters = [parameter.arg for parameter in definition.args.args[1:]]
+        defaults = definition.args.defaults
+        for parameter, default in zip(parameters[len(parameters) - len(defaults):], defaults):
+            env[parameter] = _Frame(self.scanner, self.scene, module, {}).evaluate(default)
+        for parameter, argument in zip(parameters, node.args):
+            env[parameter] = self.evaluate(argument, timing)
+        for keyword in node.keywords:
+            if keyword.arg is not None:
+                env[keyword.arg] = self.evaluate(keyword.value, timing)
+        frame = _Frame(self.scanner, self.scene, module, env, self.depth + 1)
+        frame.run(definition.body, timing)
+        return env.get("<return>", OPAQUE)
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _arithmetic(operator, left, right):
+    if not (_is_number(left) and _is_number(right)):
+        if isinstance(operator, ast.Add) and isinstance(left, list) and isinstance(right, list):
+            return left + right
+        return UNKNOWN
+    try:
+        if isinstance(operator, ast.Add):
+            return left + right
+        if isinstance(operator, ast.Sub):
+            return left - right
+        if isinstance(operator, ast.Mult):
+            return left * right
+        if isinstance(operator, ast.Div):
+            return left / right
+        if isinstance(operator, ast.FloorDiv):
+            return left // right
+    except ZeroDivisionError:
+        pass
+    return UNKNOWN
+
+
+def _comparison(operators, values):
+    """The value of a chain of comparisons, or UNKNOWN unless every operand is known."""
+    if not all(_is_known(value) for value in values):
+        return UNKNOWN
+    for operator, left, right in zip(operators, values, values[1:]):
+        try:
+            if isinstance(operator, ast.Eq):
+                result = left == right
+            elif isinstance(operator, ast.NotEq):
+                result = left != right
+            elif isinstance(operator, ast.Lt):
+                result = left < right
+            elif isinstance(operator, ast.LtE):
+                result = left <= right
+            elif isinstance(operator, ast.Gt):
+                result = left > right
+            elif isinstance(operator, ast.GtE):
+                result = left >= right
+            elif isinstance(operator, ast.In):
+                result = left in right
+            elif isinstance(operator, ast.NotIn):
+                result = left not in right
+            elif isinstance(operator, ast.Is):
+                result = left is right if left is None or right is None else UNKNOWN
+            elif isinstance(operator, ast.IsNot):
+                result = left is not right if left is None or right is None else UNKNOWN
+            else:
+                result = UNKNOWN
+        except TypeError:
+            result = UNKNOWN
+        if result is UNKNOWN or not result:
+            return result
+    return True
+
+
+def _is_known(value):
+    """Whether ``value`` is a literal the scan worked out, all the way down."""
+    if isinstance(value, (list, tuple)):
+        return all(_is_known(element) for element in value)
+    if isinstance(value, dict):
+        return all(_is_known(key) and _is_known(element) for key, element in value.items())
+    return isinstance(value, (int, float, str, bool, type(None)))
+
+
+def _builtin(name, arguments):
+    if name == "len":
+        return len(arguments[0]) if arguments and isinstance(arguments[0], (list, dict, str)) else UNKNOWN
+    if name == "range":
+        if arguments and all(isinstance(argument, int) for argument in arguments):
+            return list(range(*arguments))
+        return UNKNOWN
+    if name == "enumerate":
+        return [list(pair) for pair in enumerate(arguments[0])] if arguments and isinstance(arguments[0], list) \
+            else UNKNOWN
+    # zip: as long as the shortest known argument, unknown elements elsewhere
+    known = [argument for argument in arguments if isinstance(argument, list)]
+    if not known:
+        return UNKNOWN
+    return [
+        [argument[index] if isinstance(argument, list) else UNKNOWN for argument in arguments]
+        for index in range(min(len(argument) for argument in known))
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scripts", nargs="*", default=SCRIPTS, help=f"scripts to index (default: {' '.join(SCRIPTS)})")
+    parser.add_argument("--filter", help="only scenes whose name contains this text")
+    parser.add_argument("--json", action="store_true", help="print the index as JSON")
+    parser.add_argument("--no-cache", action="store_true", help="rescan instead of using the cached index")
+    args = parser.parse_args(argv)
+
+    cache_path = None if args.no_cache else CACHE_PATH
+    index = {}
+    for script in args.scripts:
+        scenes = load_scenes(script, cache_path)
+        if args.filter:
+            scenes = [scene for scene in scenes if args.filter.lower() in scene["name"].lower()]
+        index[script] = scenes
+    if args.json:
+        json.dump(index, sys.stdout, indent=2)
+        print()
+        return 0
+    for script, scenes in index.items():
+        print(f"{script}:")
+        for scene in scenes:
+            estimate = "" if scene["exact"] else " ~"
+            print(f"  {scene['name']:<28} {scene['duration']:>7.1f}s{estimate:<2} "
+                  f"{scene['plays']:>4} plays {scene['waits']:>4} waits")
+        total = sum(scene["duration"] for scene in scenes)
+        print(f"  {len(scenes)} scenes, {total:.1f}s\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
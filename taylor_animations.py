@@ -0,0 +1,212 @@
+"""Animations between Taylor polynomials.
+
+``Transform(prev_graph, taylor_graph)`` morphs two independently sampled
+bezier paths: manim first subdivides the curves until their point counts
+match, then moves every point in a straight line, so the in-between
+frames are not graphs of anything.  :class:`CoefficientMorph` instead
+blends the coefficients of the two polynomials,
+
+    P_alpha = (1 - alpha) P_start + alpha P_end,
+
+and redraws the graph of ``P_alpha`` on one fixed sample grid each frame
+-- a single vectorized Horner pass plus the Hermite beziers -- so every
+frame is a true polynomial graph and nothing needs aligning.
+
+For continuous sweeps through many degrees, :class:`PartialSumGraph` is
+one curve whose degree can be set to any real number -- the terms past
+the integer part enter with the fractional weight -- and that rewrites
+its own point array in place, so a ``ValueTracker`` can drive it through
+an updater at real-time preview speed::
+
+    degree = ValueTracker(1)
+    graph = PartialSumGraph(axes, coefficients("sin", 50), x, degree=1)
+    graph.add_updater(lambda graph: graph.set_degree(degree.get_value()))
+    self.play(degree.animate.set_value(50), run_time=10, rate_func=linear)
+"""
+import numpy as np
+from manim import Animation, VMobject, interpolate_color
+
+from render_profiles import curve_style
+from taylor_plotting import hermite_points
+from taylor_polynomial import TaylorPolynomial
+
+
+class CoefficientMorph(Animation):
+    """Morph the graph of ``start`` into the graph of ``end`` through their coefficients.
+
+    ``graph`` is the mobject drawn for ``start`` (e.g. by
+    :func:`~taylor_plotting.plot_samples`) and ``x`` the sample grid to
+    draw every frame on, typically the grid ``start`` was drawn on.  Both
+    polynomials need the same center.  The stroke color moves to
+    ``color`` when given.  At the end the graph is exactly what
+    ``plot_samples`` draws for ``end`` on ``x``.
+    """
+
+    def __init__(self, graph, axes, x, start, end, color=None, clip=True, **kwargs):
+        if start.center != end.center:
+            raise ValueError(f"cannot morph between centers {start.center} and {end.center}")
+        n = max(len(start.coefficients), len(end.coefficients))
+        self.start_coefficients = np.zeros(n)
+        self.start_coefficients[:len(start.coefficients)] = start.coefficients
+        self.difference = -self.start_coefficients
+        self.difference[:len(end.coefficients)] += end.coefficients
+        self.center = start.center
+        self.axes = axes
+        self.x = np.asarray(x, dtype=np.float64)
+        self.clip = clip
+        self.start_color = graph.get_stroke_color()
+        self.end_color = color if color is not None else self.start_color
+        super().__init__(graph, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        alpha = self.rate_func(alpha)
+        polynomial = TaylorPolynomial(self.start_coefficients + alpha * self.difference, self.center)
+        derivative = polynomial.derivative()
+        self.mobject.set_points(hermite_points(
+            self.axes, self.x, polynomial(self.x), derivative(self.x), self.clip,
+            function=polynomial, derivative=derivative,
+        ))
+        self.mobject.set_stroke(color=interpolate_color(self.start_color, self.end_color, alpha))
+
+
+class PartialSumGraph(VMobject):
+    """Graph of the partial sum of fractional degree ``d`` on a fixed grid.
+
+    ``P_d`` is ``P_floor(d)`` plus the next term scaled by ``d - floor(d)``,
+    so sweeping ``d`` blends smoothly from one partial sum to the next.
+    Every term ``c_k (x - center)^k`` and its derivative is tabulated on
+    the grid ``x`` up front; :meth:`set_degree` then evaluates the partial
+    sum with one weighted sum over the table and writes the Hermite
+    beziers straight into the existing point array.  With ``clip`` the
+    parts beyond the axes' ``y_range`` are cut off at the boundary, and
+    the segments wholly outside it collapse to single points, so the
+    number of points never changes.
+    """
+
+    def __init__(self, axes, coefficients, x, center=0.0, degree=0, clip=True, **kwargs):
+        super().__init__(**curve_style(kwargs))
+        self.axes = axes
+        self.clip = clip
+        coefficients = np.asarray(coefficients, dtype=np.float64)
+        self.x = np.asarray(x, dtype=np.float64)
+        t = self.x - center
+        powers = np.ones((len(coefficients), len(t)))
+        if len(coefficients) > 1:
+            powers[1:] = np.cumprod(np.broadcast_to(t, (len(coefficients) - 1, len(t))), axis=0)
+        k = np.arange(len(coefficients))[:, np.newaxis]
+        self.terms = coefficients[:, np.newaxis] * powers
+        self.slope_terms = np.zeros_like(self.terms)
+        self.slope_terms[1:] = k[1:] * coefficients[1:, np.newaxis] * powers[:-1]
+
+        # Buffers reused by every update
+        self.weights = np.zeros(len(coefficients))
+        self._y = np.empty_like(self.x)
+        self._slopes = np.empty_like(self.x)
+        self._controls = np.empty((len(self.x) - 1, 4, 2))
+        self._controls[:, 0, 0] = self.x[:-1]
+        self._controls[:, 1, 0] = self.x[:-1] + np.diff(self.x) / 3
+        self._controls[:, 2, 0] = self.x[1:] - np.diff(self.x) / 3
+        self._controls[:, 3, 0] = self.x[1:]
+        self._x_controls = self._controls[:, :, 0].copy()
+        self._scene_points = np.empty((len(self.x) - 1, 4, 3))
+        self.degree = None
+        self.set_degree(degree)
+
+    @property
+    def max_degree(self):
+        return len(self.weights) - 1
+
+    def set_degree(self, degree):
+        """Redraw the graph as ``P_degree``, reusing the point array."""
+        degree = min(max(float(degree), 0.0), self.max_degree)
+        whole = int(degree)
+        self.weights[:] = 0
+        self.weights[:whole + 1] = 1
+        if whole < self.max_degree:
+            self.weights[whole + 1] = degree - whole
+        np.dot(self.weights, self.terms, out=self._y)
+        np.dot(self.weights, self.slope_terms, out=self._slopes)
+
+        controls = self._controls
+        third = self._x_controls[:, 1] - self._x_controls[:, 0]
+        controls[:, :, 0] = self._x_controls
+        controls[:, 0, 1] = self._y[:-1]
+        controls[:, 1, 1] = self._y[:-1] + third * self._slopes[:-1]
+        controls[:, 2, 1] = self._y[1:] - third * self._slopes[1:]
+        controls[:, 3, 1] = self._y[1:]
+        if self.clip:
+            _clip_segments(controls, *self.axes.y_range[:2])
+
+        # Linear axes map data to scene coordinates affinely
+        origin = self.axes.c2p(0, 0)
+        x_unit = self.axes.c2p(1, 0) - origin
+        y_unit = self.axes.c2p(0, 1) - origin
+        points = self._scene_points
+        np.multiply(controls[:, :, :1], x_unit, out=points)
+        points += origin
+        points += controls[:, :, 1:] * y_unit
+        if self.points.shape != (points.size // 3, 3):
+            self.set_points(points.reshape(-1, 3).copy())
+        else:
+            self.points[...] = points.reshape(-1, 3)
+        self.degree = degree
+        return self
+
+
+def _clip_segments(controls, y_min, y_max):
+    """Cut bezier segments ``controls[i]`` (data coordinates) to ``y_min <= y <= y_max``.
+
+    Segments with one end inside the band are split where they cross its
+    edge; segments with neither end inside collapse to a point on the
+    edge, drawing nothing.
+    """
+    start = controls[:, 0, 1]
+    end = controls[:, 3, 1]
+    start_inside = (start >= y_min) & (start <= y_max)
+    end_inside = (end >= y_min) & (end <= y_max)
+
+    outside = ~start_inside & ~end_inside
+    if outside.any():
+        controls[outside, :, 0] = controls[outside, :1, 0]
+        controls[outside, :, 1] = np.clip(controls[outside, :1, 1], y_min, y_max)
+
+    crossing = np.flatnonzero(start_inside != end_inside)
+    if len(crossing) == 0:
+        return
+    segments = controls[crossing]
+    leaving = start_inside[crossing]
+    outer = np.where(leaving, segments[:, 3, 1], segments[:, 0, 1])
+    level = np.where(outer > y_max, y_max, y_min)
+    u = _bisect_bezier(segments[:, :, 1], level)
+    left, right = _split_bezier(segments, u)
+    controls[crossing] = np.where(leaving[:, np.newaxis, np.newaxis], left, right)
+
+
+def _bisect_bezier(y, level, iterations=40):
+    """Parameter where cubic beziers with control values ``y`` cross ``level``."""
+    lo = np.zeros(len(y))
+    hi = np.ones(len(y))
+    start_side = np.sign(y[:, 0] - level)
+    for _ in range(iterations):
+        mid = (lo + hi) / 2
+        s = 1 - mid
+        value = s**3 * y[:, 0] + 3 * s**2 * mid * y[:, 1] + 3 * s * mid**2 * y[:, 2] + mid**3 * y[:, 3]
+        before = np.sign(value - level) == start_side
+        lo = np.where(before, mid, lo)
+        hi = np.where(before, hi, mid)
+    return (lo + hi) / 2
+
+
+def _split_bezier(segments, u):
+    """De Casteljau split of cubic beziers at parameters ``u``: (left, right) parts."""
+    u = u[:, np.newaxis]
+    p0, p1, p2, p3 = segments[:, 0], segments[:, 1], segments[:, 2], segments[:, 3]
+    p01 = p0 + (p1 - p0) * u
+    p12 = p1 + (p2 - p1) * u
+    p23 = p2 + (p3 - p2) * u
+    p012 = p01 + (p12 - p01) * u
+    p123 = p12 + (p23 - p12) * u
+    point = p012 + (p123 - p012) * u
+    left = np.stack([p0, p01, p012, point], axis=1)
+    right = np.stack([point, p123, p23, p3], axis=1)
+    return left, right
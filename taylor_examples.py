@@ -0,0 +1,510 @@
+"""Data-driven Taylor series example scenes.
+
+The sin, cos, ln(1+x), e^x, arctan and 1/(1-x) examples all follow the
+same script: title, formula and expanded form, a few notes, axes with the
+true function, then a progression of partial sums morphing into each
+other, and a closing remark.  :class:`TaylorExampleScene` plays that
+script from a *spec*, a plain dict describing what differs between the
+examples, so a new function can be added as data instead of code::
+
+    class SinhExample(TaylorExampleScene):
+        spec = {
+            "title": "Taylor Series: sinh(x)",
+            "formula": r"\\sinh(x) = \\sum_{n=0}^{\\infty} \\frac{x^{2n+1}}{(2n+1)!}",
+            "expanded": r"= x + \\frac{x^3}{3!} + \\frac{x^5}{5!} + \\cdots",
+            "axes": {"x_range": [-3, 3, 1], "y_range": [-4, 4, 2], "x_length": 10, "y_length": 4},
+            "function": "sinh",
+            "function_label": r"\\sinh(x)",
+            "function_label_position": [2, 3.5],
+            "series": "sinh",
+            "degrees": [[1, "RED"], [3, "GREEN"], [5, "BLUE"]],
+            "final_note": {"text": "Like sin, without the sign changes!"},
+        }
+
+Specs can also be kept in TOML or JSON files, one table per scene, and
+turned into scene classes with :func:`scenes_from_file`.  Keys missing
+from a spec fall back to :data:`DEFAULT_SPEC`, which holds the styling of
+``taylor_series_hq.py``.
+
+Without a ``series`` key, or with a nonzero ``center``, the
+approximations are the Taylor polynomials of ``function`` itself around
+``center`` (0 by default), computed with :mod:`jets`, so any function
+built from NumPy ufuncs can be shown around any point.  With
+``"expansion": "cauchy"`` they are computed with :mod:`cauchy` instead,
+which only needs ``function`` to accept complex arrays.  A ``function``
+is a name from :data:`~taylor_polynomial.FUNCTIONS` or
+:data:`NUMPY_FUNCTIONS`, or, in specs written in Python, any callable.
+
+A ``"sweep": {"degree": 50, "run_time": 10}`` entry continues the
+progression with a continuous sweep from the last degree up to the
+given one (see :meth:`TaylorExampleScene.play_sweep`).
+
+Colors may be manim color constants, their names from :data:`COLORS`
+(``"RED"``) or hex strings; directions may be manim vectors, their names
+from :data:`DIRECTIONS` (``"DL"``) or lists of coordinates, and
+``notes_animation`` names one of :data:`NOTES_ANIMATIONS`.  Other names
+are rejected with a ``ValueError`` naming the spec key, so a spec file
+cannot reach arbitrary attributes of manim.
+"""
+import json
+import threading
+from pathlib import Path
+
+import manim
+import numpy as np
+from manim import (
+    BLACK, BOLD, DL, DOWN, DR, IN, LEFT, ORIGIN, OUT, RIGHT, UL, UP, UR, WHITE, AddTextLetterByLetter,
+    Create, DashedLine, DrawBorderThenFill, FadeIn, FadeOut, GrowFromCenter, Rectangle, Transform,
+    ValueTracker, VGroup, Write, linear,
+)
+from manim.utils.color import manim_colors
+
+from cauchy import cauchy_coefficients
+from jets import taylor_coefficients
+from render_profiles import add_background_rectangle, current_profile
+from taylor_animations import CoefficientMorph, PartialSumGraph
+from taylor_plotting import _freeze, make_axes, pixel_scales, plot_adaptive, plot_samples, sample_grid
+from taylor_polynomial import FUNCTIONS, PartialSums, TaylorPolynomial, coefficients
+from taylor_scene import TaylorScene
+from tex_cache import cached_math_tex, cached_text
+from tracing import traced
+
+
+DEFAULT_SPEC = {
+    "title_color": None,
+    "title_font_size": 56,
+    "title_buff": 0.3,
+    "title_wait": 1,
+    "subtitle": None,
+    "formula_font_size": 42,
+    "formula_buff": 0.4,
+    "expanded_font_size": 38,
+    "expanded_buff": 0.3,
+    "notes": [],
+    "note_style": {"font_size": 28},
+    "notes_buff": 0.25,
+    "notes_animation": "FadeIn",
+    "axes_placement": {"move_to": [0, -2, 0]},
+    "x_labels": None,
+    "x_label_font_size": 28,
+    "function_color": "YELLOW",
+    "function_range": None,
+    "function_stroke_width": 6,
+    "function_label_font_size": 36,
+    "label_background": True,
+    "marker": None,
+    "center": 0,
+    "expansion": "jets",
+    "approx_stroke_width": 5,
+    "approx_label": "P_{{{n}}}(x)",
+    "approx_label_font_size": 40,
+    "label_box": {"width": 2, "height": 0.8, "placement": {"to_corner": "DL", "buff": 0.5, "shift": [0, 0.3]}},
+    "approx_label_position": None,
+    "sweep": None,
+    "final_note_style": {"font_size": 34, "color": "GREEN", "weight": BOLD},
+    "final_note_placement": {"to_corner": "DR", "buff": 0.5},
+}
+
+# How specs without a series expand their function
+EXPANSIONS = {
+    "jets": taylor_coefficients,
+    "cauchy": cauchy_coefficients,
+}
+
+# Names a spec may use for colors, directions and the notes animation
+COLORS = {name: value for name, value in vars(manim_colors).items() if isinstance(value, manim.ManimColor)}
+DIRECTIONS = {
+    "ORIGIN": ORIGIN, "UP": UP, "DOWN": DOWN, "LEFT": LEFT, "RIGHT": RIGHT, "IN": IN, "OUT": OUT,
+    "UL": UL, "UR": UR, "DL": DL, "DR": DR,
+}
+NOTES_ANIMATIONS = {
+    animation.__name__: animation
+    for animation in (FadeIn, Write, Create, DrawBorderThenFill, GrowFromCenter, AddTextLetterByLetter)
+}
+
+# NumPy functions a spec may name besides FUNCTIONS, all expandable by
+# both jets and cauchy; names, unlike code, are safe to load from files
+NUMPY_FUNCTIONS = {
+    function.__name__: function
+    for function in (
+        np.exp, np.expm1, np.log, np.log1p, np.sqrt, np.sin, np.cos, np.tan,
+        np.sinh, np.cosh, np.tanh, np.arcsin, np.arccos, np.arctan, np.arctanh,
+    )
+}
+
+# Sampled progressions, shared by scenes with the same series and frame;
+# render_all --pipeline prepares scenes in a second thread
+_progression_cache = {}
+_progression_lock = threading.Lock()
+
+
+class TaylorExampleScene(TaylorScene):
+    """One Taylor series example, played from the ``spec`` class attribute."""
+
+    spec = {}
+
+    def get_spec(self):
+        return {**DEFAULT_SPEC, **self.spec}
+
+    def construct(self):
+        spec = self.get_spec()
+
+        # Title
+        title = cached_text(
+            spec["title"], **_text_style(spec["title_font_size"], spec["title_color"], BOLD, "title_color")
+        )
+        title.to_edge(UP, buff=spec["title_buff"])
+        self.play(Write(title))
+        if spec["title_wait"]:
+            self.wait(spec["title_wait"])
+        heading = title
+
+        if spec["subtitle"]:
+            subtitle = _text(spec["subtitle"], "subtitle")
+            subtitle.next_to(title, DOWN, buff=0.3)
+            self.play(Write(subtitle))
+            self.wait()
+            heading = subtitle
+
+        # Formula section
+        formula = cached_math_tex(spec["formula"], font_size=spec["formula_font_size"])
+        formula.next_to(heading, DOWN, buff=spec["formula_buff"])
+        expanded = cached_math_tex(spec["expanded"], font_size=spec["expanded_font_size"])
+        expanded.next_to(formula, DOWN, buff=spec["expanded_buff"])
+
+        notes = VGroup()
+        for note_spec in spec["notes"]:
+            note = _text({**spec["note_style"], **note_spec}, "notes")
+            if len(notes):
+                note.next_to(notes[-1], DOWN, buff=0.2)
+            else:
+                note.next_to(expanded, DOWN, buff=spec["notes_buff"])
+            notes.add(note)
+
+        self.play(Write(formula))
+        self.wait()
+        self.play(Write(expanded))
+        if len(notes):
+            self.wait()
+            animation = _notes_animation(spec["notes_animation"])
+            self.play(*[animation(note) for note in notes])
+        self.wait(2)
+
+        # Axes
+        axes = make_axes(**spec["axes"])
+        _place(axes, spec["axes_placement"], {}, "axes_placement")
+
+        if spec["x_labels"]:
+            x_labels = VGroup()
+            for x_val, tex in spec["x_labels"]:
+                label = cached_math_tex(tex, font_size=spec["x_label_font_size"])
+                label.next_to(axes.c2p(x_val, 0), DOWN, buff=0.2)
+                x_labels.add(label)
+            self.play(Create(axes), Write(x_labels))
+        else:
+            self.play(Create(axes))
+
+        # Actual function
+        function_color = _color(spec["function_color"], "function_color")
+        graph = plot_adaptive(
+            axes,
+            _function(spec["function"]),
+            color=function_color,
+            x_range=spec["function_range"] or axes.x_range,
+            stroke_width=spec["function_stroke_width"],
+        )
+        graph_label = cached_math_tex(
+            spec["function_label"], color=function_color, font_size=spec["function_label_font_size"]
+        )
+        if spec["label_background"]:
+            add_background_rectangle(graph_label, color=BLACK, opacity=0.8, buff=0.1)
+        graph_label.move_to(axes.c2p(*spec["function_label_position"]))
+
+        self.play(Create(graph), Write(graph_label))
+        self.wait()
+
+        # Marker line, e.g. the edge of convergence
+        if spec["marker"]:
+            marker = spec["marker"]
+            y_min, y_max = axes.y_range[:2]
+            line_kwargs = {"stroke_width": marker["stroke_width"]} if "stroke_width" in marker else {}
+            line = DashedLine(
+                axes.c2p(marker["x"], y_min),
+                axes.c2p(marker["x"], y_max),
+                color=_color(marker.get("color", "RED"), "marker.color"),
+                dash_length=0.1,
+                **line_kwargs
+            )
+            marker_label = _text(marker["label"], "marker.label")
+            marker_label.next_to(axes.c2p(marker["x"], y_min), DOWN, buff=marker.get("label_buff", 0.2))
+            self.play(Create(line), Write(marker_label))
+            self.wait()
+
+        # Progressive approximations
+        if spec["label_box"]:
+            box = spec["label_box"]
+            label_box = Rectangle(height=box["height"], width=box["width"], color=WHITE, stroke_width=2)
+            _place(label_box, box["placement"], {"axes": axes}, "label_box.placement")
+            self.play(Create(label_box))
+            label_position = label_box.get_center()
+        else:
+            label_position = axes.c2p(*spec["approx_label_position"])
+
+        prev_graph = None
+        prev_label = None
+
+        for (n, color), (x, y, slopes, polynomial) in zip(spec["degrees"], _progression(spec, axes)):
+            color = _color(color, "degrees")
+            taylor_label = cached_math_tex(
+                spec["approx_label"].format(n=n), color=color, font_size=spec["approx_label_font_size"]
+            )
+            taylor_label.move_to(label_position)
+
+            if prev_graph:
+                self.play(
+                    CoefficientMorph(prev_graph, axes, x, prev_polynomial, polynomial, color=color),
+                    Transform(prev_label, taylor_label)
+                )
+            else:
+                taylor_graph = plot_samples(
+                    axes, x, y, slopes=slopes, function=polynomial, derivative=polynomial.derivative(),
+                    color=color, stroke_width=spec["approx_stroke_width"]
+                )
+                self.play(Create(taylor_graph), Write(taylor_label))
+                prev_graph = taylor_graph
+                prev_label = taylor_label
+            prev_polynomial = polynomial
+
+            self.wait(2)
+
+        if spec["sweep"]:
+            self.play_sweep(spec, axes, prev_graph, prev_label, label_position)
+
+        # Final note
+        note = _text({**spec["final_note_style"], **spec["final_note"]}, "final_note")
+        _place(note, spec["final_note_placement"], {"axes": axes}, "final_note_placement")
+        self.play(Write(note))
+        self.wait(3)
+
+        self.play(*[FadeOut(mob) for mob in self.mobjects])
+
+    def get_tex_strings(self):
+        spec = self.get_spec()
+        items = [
+            ((spec["formula"],), {"font_size": spec["formula_font_size"]}),
+            ((spec["expanded"],), {"font_size": spec["expanded_font_size"]}),
+            ((spec["function_label"],), {"color": _color(spec["function_color"], "function_color"),
+                                         "font_size": spec["function_label_font_size"]}),
+        ]
+        for _, tex in spec["x_labels"] or []:
+            items.append(((tex,), {"font_size": spec["x_label_font_size"]}))
+        labels = [(n, _color(color, "degrees")) for n, color in spec["degrees"]]
+        if spec["sweep"]:
+            start, color = labels[-1]
+            labels += [(n, color) for n in range(start + 1, spec["sweep"]["degree"] + 1)]
+        for n, color in labels:
+            items.append(((spec["approx_label"].format(n=n),),
+                          {"color": color, "font_size": spec["approx_label_font_size"]}))
+        return items
+
+    def prepare(self):
+        super().prepare()
+        # Sample the progression for axes of the same size as construct's
+        spec = self.get_spec()
+        _progression(spec, make_axes(**spec["axes"]))
+
+    def play_sweep(self, spec, axes, graph, label, label_position):
+        """Sweep ``graph`` continuously from the last degree up to the ``sweep`` degree.
+
+        ``spec["sweep"]`` holds the final ``degree`` and the ``run_time``.
+        One :class:`~taylor_animations.PartialSumGraph` replaces ``graph``
+        and follows a ``ValueTracker``; ``label`` shows the current degree.
+        """
+        sweep = spec["sweep"]
+        start = spec["degrees"][-1][0]
+        series_coefficients = _series_coefficients(spec, sweep["degree"])
+        curves = [
+            TaylorPolynomial(series_coefficients[:n + 1], spec["center"])
+            for n in range(start, sweep["degree"] + 1)
+        ]
+        color = graph.get_stroke_color()
+        sweep_graph = PartialSumGraph(
+            axes, series_coefficients, sample_grid(axes, axes.x_range, curves=curves), spec["center"],
+            degree=start, color=color, stroke_width=spec["approx_stroke_width"]
+        )
+        self.remove(graph)
+        self.add(sweep_graph)
+
+        degree = ValueTracker(start)
+        shown = {"degree": start}
+
+        def relabel(mobject):
+            n = int(degree.get_value())
+            if n != shown["degree"]:
+                shown["degree"] = n
+                new_label = cached_math_tex(
+                    spec["approx_label"].format(n=n), color=color, font_size=spec["approx_label_font_size"]
+                )
+                mobject.become(new_label.move_to(label_position))
+
+        sweep_graph.add_updater(lambda mobject: mobject.set_degree(degree.get_value()))
+        label.add_updater(relabel)
+        self.play(degree.animate.set_value(sweep["degree"]), run_time=sweep.get("run_time", 8), rate_func=linear)
+        sweep_graph.clear_updaters()
+        label.clear_updaters()
+        self.wait(2)
+
+
+def scenes_from_file(path, base=TaylorExampleScene):
+    """Scene classes for every spec in a TOML or JSON file.
+
+    The file maps scene class names to specs.  Returns a dict of classes,
+    suitable for ``globals().update(...)`` in a script manim is run on.
+    """
+    path = Path(path)
+    if path.suffix == ".toml":
+        import tomllib
+
+        with open(path, "rb") as f:
+            specs = tomllib.load(f)
+    else:
+        with open(path) as f:
+            specs = json.load(f)
+    return {
+        name: type(name, (base,), {"spec": spec, "__doc__": spec.get("title", name)})
+        for name, spec in specs.items()
+    }
+
+
+@traced("plot")
+def _progression(spec, axes):
+    """Samples, slopes and polynomial of every partial sum in the spec.
+
+    The coefficients come from ``series`` -- the name of a standard
+    series or a :class:`~power_series.PowerSeries` -- or, for specs
+    without one or centered away from 0, from expanding ``function``
+    around ``center`` with :mod:`jets` or :mod:`cauchy`.  The whole
+    progression is evaluated incrementally on one shared grid, and reused
+    by any later scene with the same series, center, degrees, axes,
+    render resolution and pixel tolerance.
+    """
+    degrees = [n for n, _ in spec["degrees"]]
+    center = spec["center"]
+    series = spec.get("series") if not center else None
+    # The grid is refined to the profile's pixel tolerance
+    key = (
+        series or (spec["function"], spec["expansion"]), center, tuple(degrees), _freeze(spec["axes"]),
+        pixel_scales(axes), current_profile()["pixel_tolerance"],
+    )
+    with _progression_lock:
+        progression = _progression_cache.get(key)
+    if progression is None:
+        series_coefficients = _series_coefficients(spec, degrees[-1])
+        curves = [TaylorPolynomial(series_coefficients[:n + 1], center) for n in degrees]
+        grid = sample_grid(axes, axes.x_range, curves=curves)
+        partial_sums = PartialSums(series_coefficients, grid, center)
+        progression = [
+            (grid, partial_sums.advance(n), partial_sums.slopes(), curve)
+            for n, curve in zip(degrees, curves)
+        ]
+        with _progression_lock:
+            progression = _progression_cache.setdefault(key, progression)
+    return progression
+
+
+def _series_coefficients(spec, degree):
+    """First ``degree + 1`` coefficients of the series a spec plots."""
+    center = spec["center"]
+    # Named and algebraic series are all expansions around 0
+    series = spec.get("series") if not center else None
+    if isinstance(series, str):
+        return coefficients(series, degree)
+    if series is not None:
+        return series.coefficients[:degree + 1]
+    expand = EXPANSIONS[spec["expansion"]]
+    return expand(_function(spec["function"]), center, degree)
+
+
+def _function(value):
+    if callable(value):
+        return value
+    if value in FUNCTIONS:
+        return FUNCTIONS[value]
+    if value in NUMPY_FUNCTIONS:
+        return NUMPY_FUNCTIONS[value]
+    raise ValueError(
+        f"unknown function {value!r}, expected one of {', '.join([*FUNCTIONS, *NUMPY_FUNCTIONS])} or a callable"
+    )
+
+
+def _color(value, key):
+    if isinstance(value, str) and not value.startswith("#"):
+        if value.upper() not in COLORS:
+            raise ValueError(f"{key}: unknown color {value!r}, expected a manim color name or a hex string")
+        return COLORS[value.upper()]
+    try:
+        return manim.ManimColor(value)
+    except (ValueError, TypeError):
+        raise ValueError(f"{key}: bad color {value!r}") from None
+
+
+def _vector(value, key):
+    if isinstance(value, str):
+        if value.upper() not in DIRECTIONS:
+            raise ValueError(
+                f"{key}: unknown direction {value!r}, expected one of {', '.join(DIRECTIONS)} or coordinates"
+            )
+        return DIRECTIONS[value.upper()]
+    vector = np.zeros(3)
+    vector[:len(value)] = value
+    return vector
+
+
+def _notes_animation(value):
+    if callable(value):
+        return value
+    if value not in NOTES_ANIMATIONS:
+        raise ValueError(
+            f"notes_animation: unknown animation {value!r}, expected one of {', '.join(NOTES_ANIMATIONS)}"
+        )
+    return NOTES_ANIMATIONS[value]
+
+
+def _text_style(font_size, color=None, weight=None, key="color"):
+    style = {"font_size": font_size}
+    if color is not None:
+        style["color"] = _color(color, key)
+    if weight is not None:
+        style["weight"] = weight
+    return style
+
+
+def _text(spec, key):
+    """A ``Text`` from a dict holding ``text`` and any ``Text`` keyword arguments."""
+    kwargs = dict(spec)
+    text = kwargs.pop("text")
+    if "color" in kwargs:
+        kwargs["color"] = _color(kwargs["color"], f"{key}.color")
+    return cached_text(text, **kwargs)
+
+
+def _place(mobject, placement, anchors, key):
+    """Position ``mobject`` as described by the placement dict at spec ``key``.
+
+    One of ``move_to``, ``to_edge``, ``to_corner`` or ``next_to`` (naming
+    an entry of ``anchors``, with an optional ``direction``), plus an
+    optional ``buff`` and a final ``shift``.
+    """
+    kwargs = {"buff": placement["buff"]} if "buff" in placement else {}
+    if "move_to" in placement:
+        mobject.move_to(_vector(placement["move_to"], f"{key}.move_to"))
+    elif "to_edge" in placement:
+        mobject.to_edge(_vector(placement["to_edge"], f"{key}.to_edge"), **kwargs)
+    elif "to_corner" in placement:
+        mobject.to_corner(_vector(placement["to_corner"], f"{key}.to_corner"), **kwargs)
+    elif "next_to" in placement:
+        direction = _vector(placement.get("direction", "RIGHT"), f"{key}.direction")
+        mobject.next_to(anchors[placement["next_to"]], direction, **kwargs)
+    if "shift" in placement:
+        mobject.shift(_vector(placement["shift"], f"{key}.shift"))
+    return mobject
@@ -0,0 +1,204 @@
+"""Plotting helpers shared by the animation scripts."""
+import threading
+
+import numpy as np
+from manim import Axes, VMobject, config
+
+from curve_sampling import adaptive_samples, central_difference, clip_to_band, hermite_controls
+from render_profiles import current_profile, curve_style
+from taylor_polynomial import TaylorPolynomial
+from tracing import traced
+
+
+# Fully built axes, keyed by their frozen constructor arguments;
+# render_all --pipeline builds scenes in a second thread
+_axes_cache = {}
+_axes_lock = threading.Lock()
+
+
+@traced("axes")
+def make_axes(**kwargs):
+    """``Axes(**kwargs)``, built once per configuration and copied afterwards.
+
+    Building axes creates every tick and, with ``include_numbers``, typesets
+    one number label per tick.  Scenes with the same frame share that work:
+    the first call builds the axes, later calls with the same arguments
+    get a deep copy, which the scene can move and restyle freely.
+    """
+    key = _freeze(kwargs)
+    with _axes_lock:
+        axes = _axes_cache.get(key)
+    if axes is None:
+        axes = Axes(**kwargs)
+        with _axes_lock:
+            axes = _axes_cache.setdefault(key, axes)
+    return axes.copy()
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((name, _freeze(item)) for name, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return repr(value)
+
+
+def pixel_scales(axes):
+    """Output pixels per data unit along x and y at the active quality."""
+    pixels_per_unit = config.pixel_height / config.frame_height
+    origin = axes.c2p(0, 0)
+    return (
+        abs(axes.c2p(1, 0)[0] - origin[0]) * pixels_per_unit,
+        abs(axes.c2p(0, 1)[1] - origin[1]) * pixels_per_unit,
+    )
+
+
+def visible_y_bounds(axes):
+    """Range of data y values that falls inside the frame."""
+    origin_y = axes.c2p(0, 0)[1]
+    unit_y = axes.c2p(0, 1)[1] - origin_y
+    bottom = (-config.frame_height / 2 - origin_y) / unit_y
+    top = (config.frame_height / 2 - origin_y) / unit_y
+    return min(bottom, top), max(bottom, top)
+
+
+@traced("plot")
+def sample_grid(axes, *x_ranges, curves=(), tolerance=None, clip=True):
+    """Sample points covering every range in ``x_ranges``.
+
+    With ``curves`` (callables with a ``derivative()``, such as
+    :class:`~taylor_polynomial.TaylorPolynomial`), the grid is the union
+    of the adaptive samples each curve needs to be drawn within
+    ``tolerance`` pixels (the render profile's ``pixel_tolerance`` by
+    default); with ``clip`` only the part inside the axes' ``y_range`` is
+    refined, matching :func:`plot_samples`.  Otherwise the spacing matches
+    what ``axes.plot`` would use.  Each range's endpoints are always
+    included exactly, so a curve restricted to any one of the ranges
+    starts and ends where ``axes.plot`` would have.
+    """
+    if tolerance is None:
+        tolerance = current_profile()["pixel_tolerance"]
+    x_min = min(x_range[0] for x_range in x_ranges)
+    x_max = max(x_range[1] for x_range in x_ranges)
+    endpoints = [bound for x_range in x_ranges for bound in x_range[:2]]
+    if curves:
+        x_scale, y_scale = pixel_scales(axes)
+        y_bounds = axes.y_range[:2] if clip else visible_y_bounds(axes)
+        grids = [
+            adaptive_samples(curve, x_min, x_max, x_scale, y_scale, df=curve.derivative(),
+                             tolerance=tolerance, y_bounds=y_bounds)
+            for curve in curves
+        ]
+        return np.unique(np.concatenate([*grids, endpoints]))
+    step = axes.x_range[2] / axes.num_sampled_graph_points_per_tick
+    grid = np.append(np.arange(x_min, x_max, step), x_max)
+    return np.union1d(grid, endpoints)
+
+
+@traced("plot")
+def plot_samples(axes, x, y, slopes=None, x_range=None, clip=True, function=None, derivative=None,
+                 use_smoothing=None, **kwargs):
+    """Graph through precomputed samples ``(x, y)``, a drop-in for ``axes.plot``.
+
+    With ``slopes`` (dy/dx at each sample) the graph is a cubic Hermite
+    spline with exact tangents; otherwise the samples are joined as
+    corners and smoothed if ``use_smoothing`` (by default, if the render
+    profile smooths).  Only the samples inside ``x_range`` are used when
+    it is given.
+
+    With ``clip`` the samples are first trimmed to the axes' ``y_range``,
+    so parts of the curve beyond it are never turned into beziers.  Each
+    visible piece ends exactly on the boundary; pass the plotted
+    ``function`` (and its ``derivative``) to locate those crossings on
+    the function itself rather than on the interpolating spline.
+
+    Remaining keyword arguments are passed to :class:`~.VMobject`, with
+    the stroke width scaled by the render profile.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if slopes is not None:
+        slopes = np.asarray(slopes, dtype=np.float64)
+    if x_range is not None:
+        keep = (x >= x_range[0]) & (x <= x_range[1])
+        x, y = x[keep], y[keep]
+        if slopes is not None:
+            slopes = slopes[keep]
+
+    graph = VMobject(**curve_style(kwargs))
+    if slopes is not None:
+        graph.set_points(hermite_points(axes, x, y, slopes, clip, function, derivative))
+        return graph
+
+    if clip:
+        y_min, y_max = axes.y_range[:2]
+        runs = clip_to_band(x, y, np.gradient(y, x), y_min, y_max, f=function, df=derivative)
+    else:
+        runs = [(x, y, slopes)]
+    for run_x, run_y, _ in runs:
+        points = axes.c2p(run_x, run_y).T
+        graph.start_new_path(points[0])
+        graph.add_points_as_corners(points[1:])
+    if use_smoothing is None:
+        use_smoothing = current_profile()["smoothing"]
+    if use_smoothing:
+        graph.make_smooth()
+    return graph
+
+
+def hermite_points(axes, x, y, slopes, clip=True, function=None, derivative=None):
+    """Bezier points of the Hermite spline through ``(x, y)``, in scene coordinates.
+
+    The points :func:`plot_samples` gives its graph when ``slopes`` are
+    known, clipped the same way; an empty array if nothing is visible.
+    """
+    if clip:
+        y_min, y_max = axes.y_range[:2]
+        runs = clip_to_band(x, y, slopes, y_min, y_max, f=function, df=derivative)
+    else:
+        runs = [(x, y, slopes)]
+    if not runs:
+        return np.zeros((0, 3))
+    controls = np.concatenate([hermite_controls(*run) for run in runs])
+    return axes.c2p(controls[:, 0], controls[:, 1]).T
+
+
+@traced("plot")
+def plot_adaptive(axes, function, x_range=None, derivative=None, tolerance=None, clip=True,
+                  **kwargs):
+    """Adaptively sampled graph of ``function``, a drop-in for ``axes.plot``.
+
+    ``function`` must accept NumPy arrays.  Its derivative is taken from
+    ``derivative``, from ``function.derivative()`` when available (as on
+    :class:`~taylor_polynomial.TaylorPolynomial`), or else estimated
+    numerically.  Samples are placed so the drawn curve stays within
+    ``tolerance`` pixels of the true graph at the active render quality
+    (the render profile's ``pixel_tolerance`` by default).  With ``clip`` the curve is trimmed to the axes' ``y_range`` (see
+    :func:`plot_samples`), otherwise only stretches beyond the frame are
+    left unrefined.
+    """
+    if x_range is None:
+        x_range = axes.x_range
+    if tolerance is None:
+        tolerance = current_profile()["pixel_tolerance"]
+    if derivative is None:
+        derivative = function.derivative() if hasattr(function, "derivative") else central_difference(function)
+    x_scale, y_scale = pixel_scales(axes)
+    y_bounds = axes.y_range[:2] if clip else visible_y_bounds(axes)
+    x = adaptive_samples(function, x_range[0], x_range[1], x_scale, y_scale, df=derivative,
+                         tolerance=tolerance, y_bounds=y_bounds)
+    return plot_samples(axes, x, function(x), slopes=derivative(x), clip=clip, function=function,
+                        derivative=derivative, **kwargs)
+
+
+@traced("plot")
+def plot_partial_sum(axes, partial_sums, degree, **kwargs):
+    """Advance ``partial_sums`` to ``degree`` and graph it on its grid.
+
+    Keyword arguments are those of :func:`plot_samples`; clipping
+    crossings are located on the partial sum itself.
+    """
+    y = partial_sums.advance(degree)
+    polynomial = TaylorPolynomial(partial_sums.coefficients[:degree + 1], partial_sums.center)
+    return plot_samples(axes, partial_sums.x, y, slopes=partial_sums.slopes(), function=polynomial,
+                        derivative=polynomial.derivative(), **kwargs)
@@ -0,0 +1,186 @@
+"""Vectorized Taylor polynomials shared by the animation scripts.
+
+Every approximation drawn in the example scenes is a truncated Taylor
+series.  Instead of hand-writing one lambda per partial sum, the scenes
+ask this module for a :class:`TaylorPolynomial` and hand it straight to
+``axes.plot(..., use_vectorized=True)``, which evaluates all sample points
+in one Horner pass over a NumPy array.
+"""
+import os
+
+import numpy as np
+
+
+# Highest degree precomputed for the standard series.  Override with the
+# TAYLOR_MAX_DEGREE environment variable or set_max_degree().
+MAX_DEGREE = int(os.environ.get("TAYLOR_MAX_DEGREE", 64))
+
+
+def build_coefficient_table(max_degree):
+    """Compute the coefficients of every standard series up to ``max_degree``.
+
+    Returns a dict mapping series name to a read-only, contiguous float64
+    array of length ``max_degree + 1`` whose k-th entry multiplies x^k.
+    Reciprocal factorials come from one running product, so no factorial
+    is ever evaluated twice.
+    """
+    k = np.arange(max_degree + 1, dtype=np.float64)
+    inv_factorial = np.ones(max_degree + 1)
+    inv_factorial[1:] = np.cumprod(1 / k[1:])
+    odd = (np.arange(max_degree + 1) % 2).astype(bool)
+    # (-1)^floor(k/2): +1, +1, -1, -1, +1, +1, ...
+    alternating = np.where(np.arange(max_degree + 1) // 2 % 2, -1.0, 1.0)
+    inv_k = np.zeros(max_degree + 1)
+    inv_k[1:] = 1 / k[1:]
+
+    table = {
+        "sin": np.where(odd, alternating * inv_factorial, 0.0),
+        "cos": np.where(odd, 0.0, alternating * inv_factorial),
+        "exp": inv_factorial.copy(),
+        "ln1p": np.where(odd, inv_k, -inv_k),
+        "arctan": np.where(odd, alternating * inv_k, 0.0),
+        "geometric": np.ones(max_degree + 1),
+        "sinh": np.where(odd, inv_factorial, 0.0),
+        "cosh": np.where(odd, 0.0, inv_factorial),
+    }
+    for coefficients in table.values():
+        coefficients.flags.writeable = False
+    return table
+
+
+COEFFICIENTS = build_coefficient_table(MAX_DEGREE)
+
+# The true functions behind the standard series, for reference curves
+FUNCTIONS = {
+    "sin": np.sin,
+    "cos": np.cos,
+    "exp": np.exp,
+    "ln1p": np.log1p,
+    "arctan": np.arctan,
+    "geometric": lambda x: 1 / (1 - x),
+    "sinh": np.sinh,
+    "cosh": np.cosh,
+}
+
+
+def set_max_degree(max_degree):
+    """Rebuild :data:`COEFFICIENTS` so it holds terms up to ``max_degree``."""
+    global MAX_DEGREE
+    MAX_DEGREE = max_degree
+    COEFFICIENTS.update(build_coefficient_table(max_degree))
+
+
+def coefficients(name, degree):
+    """First ``degree + 1`` coefficients of the named series.
+
+    The result is a view into the precomputed table, not a copy.  Asking
+    for more terms than the table holds grows the table once.
+    """
+    if name not in COEFFICIENTS:
+        raise KeyError(f"unknown series {name!r}; expected one of {sorted(COEFFICIENTS)}")
+    if degree > MAX_DEGREE:
+        set_max_degree(max(degree, 2 * MAX_DEGREE))
+    return COEFFICIENTS[name][:degree + 1]
+
+
+class TaylorPolynomial:
+    """Truncated Taylor series sum_k c_k (x - center)^k.
+
+    Calling the polynomial evaluates it with Horner's scheme.  Arrays are
+    processed in a single pass of in-place NumPy operations, so the cost
+    is one multiply-add per coefficient regardless of the sample count.
+    Scalars are accepted too and return a plain float.
+    """
+
+    def __init__(self, coefficients, center=0.0):
+        self.coefficients = np.ascontiguousarray(coefficients, dtype=np.float64)
+        if self.coefficients.ndim != 1 or len(self.coefficients) == 0:
+            raise ValueError("coefficients must be a non-empty 1-D sequence")
+        self.center = float(center)
+
+    @property
+    def degree(self):
+        return len(self.coefficients) - 1
+
+    def truncate(self, degree):
+        """Return the partial sum P_degree of this polynomial."""
+        return TaylorPolynomial(self.coefficients[:degree + 1], self.center)
+
+    def derivative(self):
+        """Return the derivative, itself a polynomial around the same center."""
+        if self.degree == 0:
+            return TaylorPolynomial([0.0], self.center)
+        return TaylorPolynomial(self.coefficients[1:] * np.arange(1, self.degree + 1), self.center)
+
+    def __call__(self, x):
+        t = np.asarray(x, dtype=np.float64)
+        if self.center:
+            t = t - self.center
+        result = np.full(t.shape, self.coefficients[-1])
+        for c in self.coefficients[-2::-1]:
+            result *= t
+            result += c
+        if result.ndim == 0:
+            return float(result)
+        return result
+
+    def __repr__(self):
+        return f"TaylorPolynomial(degree={self.degree}, center={self.center:g})"
+
+
+class PartialSums:
+    """Successive partial sums of one series on a fixed sample grid.
+
+    The scenes step through P_1, P_3, P_5, ... of the same series over the
+    same x values.  Rather than evaluating each partial sum from scratch,
+    this keeps the running sum and the running power (x - center)^k, and
+    :meth:`advance` only adds the terms between the previous degree and
+    the requested one.  A whole progression therefore costs
+    O(max degree * samples).  The slope of the current partial sum is
+    tracked the same way, for drawing the curve with exact tangents.
+    """
+
+    def __init__(self, coefficients, x, center=0.0):
+        self.coefficients = np.asarray(coefficients, dtype=np.float64)
+        self.x = np.asarray(x, dtype=np.float64)
+        self.center = float(center)
+        self.degree = -1
+        self._t = self.x - self.center
+        # t^k and t^(k-1) for the next degree k to be added
+        self._power = np.ones_like(self._t)
+        self._lower_power = np.zeros_like(self._t)
+        self._sum = np.zeros_like(self._t)
+        self._slope = np.zeros_like(self._t)
+        self._term = np.empty_like(self._t)
+
+    def advance(self, degree):
+        """Move to P_degree and return its values on the grid."""
+        if degree < self.degree:
+            raise ValueError(f"partial sums only move forward (at degree {self.degree}, asked for {degree})")
+        if degree >= len(self.coefficients):
+            raise ValueError(f"only {len(self.coefficients)} coefficients available, asked for degree {degree}")
+        for k in range(self.degree + 1, degree + 1):
+            c = self.coefficients[k]
+            if c:
+                np.multiply(self._power, c, out=self._term)
+                self._sum += self._term
+                # d/dx c t^k = k c t^(k-1)
+                if k:
+                    np.multiply(self._lower_power, k * c, out=self._term)
+                    self._slope += self._term
+            np.multiply(self._power, self._t, out=self._lower_power)
+            self._power, self._lower_power = self._lower_power, self._power
+        self.degree = degree
+        return self._sum.copy()
+
+    def slopes(self):
+        """Derivative of the current partial sum on the grid."""
+        return self._slope.copy()
+
+
+def taylor(name, degree):
+    """Partial sum P_degree of the named standard series around 0.
+
+    ``name`` is one of the keys of :data:`COEFFICIENTS`.
+    """
+    return TaylorPolynomial(coefficients(name, degree))
@@ -0,0 +1,72 @@
+"""Base class shared by every scene in the animation scripts."""
+from manim import DEFAULT_WAIT_TIME, Camera, RendererType, Scene, config
+
+from frame_writer import LAYERS, StatsRenderer
+from render_profiles import current_profile
+from tex_batch import prepare_math_tex
+from tex_cache import cached_math_tex
+from tracing import TRACE_DIR, trace_scene
+
+
+class TaylorScene(Scene):
+    """Scene rendered through :class:`~frame_writer.StatsRenderer` with the Cairo renderer.
+
+    Waits are scaled by the render profile (see render_profiles.py).
+    """
+
+    prepared = False
+
+    def __init__(self, renderer=None, **kwargs):
+        if renderer is None and config.renderer == RendererType.CAIRO:
+            renderer = StatsRenderer(
+                camera_class=kwargs.get("camera_class", Camera),
+                skip_animations=kwargs.get("skip_animations", False),
+            )
+        super().__init__(renderer=renderer, **kwargs)
+
+    def setup(self):
+        if not self.prepared:
+            self.prepare()
+
+    def prepare(self):
+        """Work that construct needs done but that does not touch the scene.
+
+        Typesets the scene's formulas in one LaTeX run (see tex_batch.py)
+        and loads them from the tex cache.  Runs before ``construct``, or
+        earlier in a background thread while another scene renders (see
+        ``render_all.py --pipeline``); subclasses can add their own
+        expensive, scene-independent steps, such as sampling curves.
+        """
+        items = self.get_tex_strings()
+        prepare_math_tex(items)
+        for tex_strings, kwargs in items:
+            cached_math_tex(*tex_strings, **kwargs)
+        self.prepared = True
+
+    def get_tex_strings(self):
+        """``(tex_strings, kwargs)`` of the ``MathTex`` the scene will build, to typeset up front."""
+        return []
+
+    def wait(self, duration=DEFAULT_WAIT_TIME, *args, **kwargs):
+        return super().wait(duration * current_profile()["wait_scale"], *args, **kwargs)
+
+    def get_moving_mobjects(self, *animations):
+        # manim treats everything drawn after the first moving mobject as
+        # moving; StatsRenderer keeps static mobjects above moving ones as
+        # prerendered overlays, so only what changes has to be listed
+        if not LAYERS or not isinstance(self.renderer, StatsRenderer):
+            return super().get_moving_mobjects(*animations)
+        animation_mobjects = [animation.mobject for animation in animations]
+        return [
+            mobject for mobject in self.get_mobject_family_members()
+            if mobject in animation_mobjects
+            or mobject.get_family_updaters()
+            or mobject in self.foreground_mobjects
+        ]
+
+    def render(self, preview=False):
+        # With TAYLOR_TRACE set, time the scene's steps (see tracing.py)
+        if TRACE_DIR is None:
+            return super().render(preview)
+        with trace_scene(self):
+            return super().render(preview)
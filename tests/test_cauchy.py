@@ -0,0 +1,78 @@
+import math
+
+import numpy as np
+import pytest
+
+import cauchy
+from cauchy import cauchy_coefficients, cauchy_expansion
+from jets import taylor_coefficients
+from taylor_polynomial import coefficients
+
+
+@pytest.mark.parametrize("function, name", [(np.log1p, "ln1p"), (np.arctan, "arctan")])
+def test_degree_1000(function, name):
+    result = cauchy_coefficients(function, 0.0, 1000)
+    expected = coefficients(name, 1000)
+    nonzero = expected != 0
+    np.testing.assert_allclose(result[nonzero], expected[nonzero], rtol=1e-9)
+    assert np.abs(result[~nonzero]).max() < 1e-12
+
+
+@pytest.mark.parametrize("function, center", [(np.tan, 0.0), (np.tanh, 0.3), (np.arcsin, 0.7), (np.log, 2.0)])
+def test_circles_past_a_singularity_are_not_used(function, center):
+    # Poles at +-pi/2 and +-i pi/2, branch points at 1 and 0: larger
+    # circles give coefficients that look accurate but are not
+    result, info = cauchy_coefficients(function, center, 15, full_output=True)
+    expected = taylor_coefficients(function, center, 15)
+    np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-14)
+    np.testing.assert_array_less(np.abs(result - expected), 10 * info["error"] + 1e-15)
+
+
+def test_entire_functions_stop_sweeping(monkeypatch):
+    # The error of every coefficient stops improving long before the
+    # largest trial circle, and larger ones are not tried
+    radii = []
+    circle_coefficients = cauchy._circle_coefficients
+
+    def record(f, center, n, r, samples):
+        radii.append(r)
+        return circle_coefficients(f, center, n, r, samples)
+
+    monkeypatch.setattr(cauchy, "_circle_coefficients", record)
+    result = cauchy.cauchy_coefficients(np.exp, 0.0, 1000)
+    np.testing.assert_allclose(result[:171], coefficients("exp", 170), rtol=1e-12)
+    assert max(radii) < 300 and len(radii) < 100
+
+
+def test_entire_function_at_nonzero_center():
+    expected = [math.e / math.factorial(k) for k in range(21)]
+    np.testing.assert_allclose(cauchy_coefficients(np.exp, 1.0, 20), expected, rtol=1e-12)
+
+
+def test_full_output():
+    result, info = cauchy_coefficients(np.log1p, 0.0, 50, full_output=True)
+    assert info["radius"].shape == info["error"].shape == result.shape == (51,)
+    # No circle reaching the singularity at -1 is of use for high degrees
+    assert info["radius"].max() < 1
+    np.testing.assert_array_less(np.abs(result - coefficients("ln1p", 50)), 10 * info["error"] + 1e-15)
+
+
+def test_fixed_radius():
+    np.testing.assert_allclose(cauchy_coefficients(np.exp, 0.0, 10, radius=1.0),
+                               coefficients("exp", 10), atol=1e-15)
+
+
+def test_no_analytic_circle():
+    with pytest.raises(ValueError, match="not analytic"):
+        cauchy_coefficients(lambda z: 1 / z, 0.0, 5)
+
+
+def test_too_few_samples():
+    with pytest.raises(ValueError):
+        cauchy_coefficients(np.exp, 0.0, 40, samples=64)
+
+
+def test_expansion():
+    polynomial = cauchy_expansion(np.cos, 0.0, 12)
+    x = np.linspace(-1, 1, 5)
+    np.testing.assert_allclose(polynomial(x), np.cos(x), atol=1e-9)
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from curve_sampling import adaptive_samples, central_difference, clip_to_band, hermite_controls
+
+
+def test_adaptive_samples_follow_the_curvature():
+    x = adaptive_samples(np.sin, 0, 2 * np.pi, 100, 100, df=np.cos)
+    assert x[0] == 0 and x[-1] == 2 * np.pi
+    assert np.all(np.diff(x) > 0)
+    # A straight line needs no refinement at all
+    assert len(adaptive_samples(lambda x: 2 * x, 0, 1, 100, 100, df=lambda x: np.full_like(x, 2.0))) == 17
+
+
+def test_adaptive_samples_meet_the_tolerance():
+    f, df = np.exp, np.exp
+    x = adaptive_samples(f, 0, 3, 200, 20, df=df, tolerance=0.5)
+    controls = hermite_controls(x, f(x), df(x)).reshape(-1, 4, 2)
+    # Midpoint of each bezier segment against the true curve, in pixels
+    middle = (controls[:, 0] + 3 * controls[:, 1] + 3 * controls[:, 2] + controls[:, 3]) / 8
+    assert np.abs(middle[:, 1] - f(middle[:, 0])).max() * 20 <= 0.5
+
+
+def test_adaptive_samples_skip_invisible_intervals():
+    bounded = adaptive_samples(lambda x: x ** 8, -3, 3, 100, 100, df=lambda x: 8 * x ** 7, y_bounds=(-1, 1))
+    unbounded = adaptive_samples(lambda x: x ** 8, -3, 3, 100, 100, df=lambda x: 8 * x ** 7)
+    assert len(bounded) < len(unbounded)
+
+
+def test_hermite_controls():
+    controls = hermite_controls([0, 3], [0, 3], [1, 1])
+    np.testing.assert_allclose(controls, [[0, 0], [1, 1], [2, 2], [3, 3]])
+
+
+def test_clip_to_band_ends_runs_on_the_boundary():
+    x = np.linspace(-2, 2, 41)
+    runs = clip_to_band(x, x ** 2, 2 * x, -1, 1, f=lambda x: x ** 2, df=lambda x: 2 * x)
+    assert len(runs) == 1
+    run_x, run_y, run_slopes = runs[0]
+    assert run_x[0] == pytest.approx(-1) and run_x[-1] == pytest.approx(1)
+    assert run_y[0] == 1 and run_y[-1] == 1
+    np.testing.assert_allclose(run_slopes[[0, -1]], [-2, 2])
+
+
+def test_clip_to_band_without_f_uses_the_hermite_segment():
+    x = np.linspace(0, 2, 5)
+    runs = clip_to_band(x, x ** 3, 3 * x ** 2, -1, 1)
+    # Hermite segments reproduce cubics exactly
+    assert runs[0][0][-1] == pytest.approx(1)
+
+
+def test_clip_to_band_splits_into_runs():
+    x = np.linspace(0, 4 * np.pi, 400)
+    runs = clip_to_band(x, 2 * np.sin(x), 2 * np.cos(x), -1, 1, f=lambda x: 2 * np.sin(x))
+    # Around every multiple of pi, where 2 sin(x) is small
+    assert len(runs) == 5
+    for run_x, run_y, _ in runs:
+        assert np.all(np.abs(run_y) <= 1)
+
+
+def test_clip_to_band_everything_outside():
+    x = np.linspace(0, 1, 5)
+    assert clip_to_band(x, x + 5, np.ones_like(x), -1, 1) == []
+
+
+def test_central_difference():
+    np.testing.assert_allclose(central_difference(np.sin)(np.linspace(0, 1, 5)), np.cos(np.linspace(0, 1, 5)),
+                               atol=1e-8)
@@ -0,0 +1,23 @@
+import pytest
+
+pytest.importorskip("av")
+pytest.importorskip("manim")
+
+from frame_writer import parse_renditions  # noqa: E402
+
+
+def test_parse_renditions():
+    assert parse_renditions("720p30, 480p,480p10.gif,1080P60.WEBM") == [
+        (720, 30, ".mp4"), (480, None, ".mp4"), (480, 10, ".gif"), (1080, 60, ".webm"),
+    ]
+
+
+def test_parse_renditions_empty():
+    assert parse_renditions("") == []
+    assert parse_renditions(" , ") == []
+
+
+@pytest.mark.parametrize("setting", ["720", "p30", "720p30.mov", "720p30,hd", "-480p"])
+def test_parse_renditions_rejects_bad_entries(setting):
+    with pytest.raises(ValueError, match="bad rendition"):
+        parse_renditions(setting)
@@ -0,0 +1,57 @@
+import math
+
+import numpy as np
+import pytest
+
+from jets import taylor_coefficients, taylor_expansion
+from taylor_polynomial import FUNCTIONS, coefficients
+
+
+@pytest.mark.parametrize("name", ["sin", "cos", "exp", "ln1p", "arctan", "geometric", "sinh", "cosh"])
+def test_standard_series(name):
+    np.testing.assert_allclose(taylor_coefficients(FUNCTIONS[name], 0.0, 30), coefficients(name, 30), atol=1e-15)
+
+
+def test_product():
+    # e^x sin(x) = x + x^2 + x^3/3 - x^5/30 - ...
+    expected = [0, 1, 1, 1 / 3, 0, -1 / 30]
+    np.testing.assert_allclose(taylor_coefficients(lambda x: np.exp(x) * np.sin(x), 0.0, 5), expected, atol=1e-15)
+
+
+def test_nonzero_center():
+    expected = [math.e / math.factorial(k) for k in range(11)]
+    np.testing.assert_allclose(taylor_coefficients(np.exp, 1.0, 10), expected, rtol=1e-14)
+    # ln(x) around 2: ln 2, then (-1)^(k+1) / (k 2^k)
+    expected = [math.log(2)] + [(-1) ** (k + 1) / (k * 2 ** k) for k in range(1, 11)]
+    np.testing.assert_allclose(taylor_coefficients(np.log, 2.0, 10), expected, rtol=1e-14)
+
+
+def test_composition_and_powers():
+    # 1 / sqrt(1 - x^2) = sum C(2n, n) x^(2n) / 4^n
+    result = taylor_coefficients(lambda x: (1 - x ** 2) ** -0.5, 0.0, 8)
+    expected = [math.comb(k, k // 2) / 4 ** (k // 2) if k % 2 == 0 else 0 for k in range(9)]
+    np.testing.assert_allclose(result, expected, atol=1e-15)
+    np.testing.assert_allclose(taylor_coefficients(lambda x: np.sin(np.sin(x)), 0.0, 5), [0, 1, 0, -1 / 3, 0, 1 / 10],
+                               atol=1e-15)
+
+
+def test_array_of_centers():
+    centers = np.array([0.0, 0.5, 1.0])
+    result = taylor_coefficients(np.exp, centers, 4)
+    assert result.shape == (5, 3)
+    for column, center in enumerate(centers):
+        np.testing.assert_allclose(result[:, column], taylor_coefficients(np.exp, center, 4))
+
+
+def test_constant_function():
+    np.testing.assert_array_equal(taylor_coefficients(lambda x: 2.0, 0.0, 3), [2, 0, 0, 0])
+
+
+def test_degree_zero():
+    np.testing.assert_allclose(taylor_coefficients(np.cos, 0.5, 0), [np.cos(0.5)])
+
+
+def test_expansion_matches_function_near_center():
+    polynomial = taylor_expansion(np.arctan, 0.5, 20)
+    x = np.linspace(0.3, 0.7, 9)
+    np.testing.assert_allclose(polynomial(x), np.arctan(x), atol=1e-12)
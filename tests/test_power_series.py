@@ -0,0 +1,76 @@
+import math
+
+import numpy as np
+import pytest
+
+from jets import taylor_coefficients
+from power_series import FFT_THRESHOLD, PowerSeries
+from taylor_polynomial import coefficients
+
+
+def test_multiply():
+    product = PowerSeries.named("exp", 20) * PowerSeries.named("sin", 20)
+    np.testing.assert_allclose(product.coefficients, taylor_coefficients(lambda x: np.exp(x) * np.sin(x), 0.0, 20),
+                               atol=1e-16)
+
+
+def test_fft_multiply_matches_direct():
+    order = 4 * FFT_THRESHOLD
+    product = PowerSeries.named("sin", order) * PowerSeries.named("cos", order)
+    # sin(x) cos(x) = sin(2x) / 2
+    expected = coefficients("sin", order) * 2.0 ** np.arange(order + 1) / 2
+    np.testing.assert_allclose(product.coefficients, expected, atol=1e-15)
+
+
+def test_sin_squared_plus_cos_squared():
+    sin, cos = PowerSeries.named("sin", 100), PowerSeries.named("cos", 100)
+    np.testing.assert_allclose((sin ** 2 + cos ** 2).coefficients, np.eye(1, 101)[0], atol=1e-15)
+
+
+def test_reciprocal():
+    np.testing.assert_allclose(PowerSeries.named("geometric", 50).reciprocal().coefficients,
+                               np.r_[1.0, -1.0, np.zeros(49)], atol=1e-15)
+    np.testing.assert_allclose((PowerSeries.named("exp", 30) * PowerSeries.named("exp", 30).reciprocal()).coefficients,
+                               np.eye(1, 31)[0], atol=1e-14)
+
+
+def test_reciprocal_of_zero_constant_term():
+    with pytest.raises(ZeroDivisionError):
+        PowerSeries.named("sin", 5).reciprocal()
+
+
+def test_division():
+    x = PowerSeries.variable(20)
+    # ln(1 + x) / (1 - x) has the harmonic numbers with alternating signs summed
+    expected = np.cumsum(coefficients("ln1p", 20))
+    np.testing.assert_allclose((PowerSeries.named("ln1p", 20) / (1 - x)).coefficients, expected, atol=1e-15)
+
+
+def test_compose():
+    # exp(ln(1 + x)) = 1 + x
+    composed = PowerSeries.named("exp", 30).compose(PowerSeries.named("ln1p", 30))
+    np.testing.assert_allclose(composed.coefficients, np.r_[1.0, 1.0, np.zeros(29)], atol=1e-13)
+    # sin(sin(x))
+    composed = PowerSeries.named("sin", 9).compose(PowerSeries.named("sin", 9))
+    np.testing.assert_allclose(composed.coefficients, taylor_coefficients(lambda x: np.sin(np.sin(x)), 0.0, 9),
+                               atol=1e-15)
+
+
+def test_compose_needs_zero_constant_term():
+    with pytest.raises(ValueError):
+        PowerSeries.named("exp", 5).compose(PowerSeries.named("cos", 5))
+
+
+def test_derivative_and_integral():
+    sin = PowerSeries.named("sin", 20)
+    np.testing.assert_allclose(sin.derivative().coefficients, coefficients("cos", 19), atol=1e-16)
+    np.testing.assert_allclose(sin.derivative().integral().coefficients, sin.coefficients, atol=1e-16)
+    assert PowerSeries([3.0]).derivative().coefficients.tolist() == [0.0]
+
+
+def test_mixed_orders_truncate_to_the_shorter():
+    assert (PowerSeries.named("exp", 10) + PowerSeries.named("sin", 4)).order == 4
+
+
+def test_evaluation():
+    assert PowerSeries.named("exp", 30)(0.5) == pytest.approx(math.exp(0.5), rel=1e-15)
@@ -0,0 +1,125 @@
+import json
+import textwrap
+from pathlib import Path
+
+from scene_manifest import load_scenes
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+def write_script(tmp_path, source):
+    script = tmp_path / "scenes.py"
+    script.write_text(textwrap.dedent(source))
+    return script
+
+
+def test_plays_waits_loops_and_helpers(tmp_path):
+    script = write_script(tmp_path, """
+        from manim import *
+
+        class Demo(Scene):
+            def construct(self):
+                self.play(Write(Text("a")), run_time=2)
+                for _ in range(3):
+                    self.wait(0.5)
+                self.finish()
+
+            def finish(self):
+                self.play(FadeOut(Text("a")))
+                self.wait()
+
+        class NotAScene:
+            def construct(self):
+                self.wait(100)
+    """)
+    [scene] = load_scenes(script, cache_path=None)
+    assert scene["name"] == "Demo"
+    assert scene["duration"] == 5.5
+    assert (scene["plays"], scene["waits"]) == (2, 4)
+    assert (scene["play_seconds"], scene["wait_seconds"]) == (3.0, 2.5)
+    assert scene["exact"]
+
+
+def test_unknown_values_make_the_estimate_approximate(tmp_path):
+    script = write_script(tmp_path, """
+        from manim import *
+        import random
+
+        class Guess(Scene):
+            def construct(self):
+                self.wait(random.random())
+                self.play(Create(Circle()))
+    """)
+    [scene] = load_scenes(script, cache_path=None)
+    assert not scene["exact"]
+
+
+def test_comparisons_pick_the_branch_that_runs(tmp_path):
+    script = write_script(tmp_path, """
+        from manim import *
+
+        class Terms(Scene):
+            def construct(self):
+                for n in range(3):
+                    self.wait()
+                    if n < 2:
+                        self.play(Create(Circle()))
+                if "sin" in ["cos", "tan"]:
+                    self.wait(10)
+    """)
+    [scene] = load_scenes(script, cache_path=None)
+    assert (scene["plays"], scene["waits"], scene["duration"]) == (2, 3, 5.0)
+    assert scene["exact"]
+
+
+def test_comparisons_with_unknown_operands_are_approximate(tmp_path):
+    script = write_script(tmp_path, """
+        from manim import *
+
+        class Check(Scene):
+            def construct(self):
+                circle = Circle()
+                if circle.width > 1:
+                    self.wait(3)
+    """)
+    [scene] = load_scenes(script, cache_path=None)
+    assert (scene["duration"], scene["exact"]) == (3.0, False)
+
+
+def test_subclasses_of_project_scenes(tmp_path):
+    write_script(tmp_path, "")
+    (tmp_path / "base.py").write_text(textwrap.dedent("""
+        from manim import *
+
+        class TimedScene(Scene):
+            pause = 2
+
+            def construct(self):
+                self.wait(self.pause)
+    """))
+    script = tmp_path / "scenes.py"
+    script.write_text("from base import TimedScene\n\nclass Long(TimedScene):\n    pause = 4\n")
+    [scene] = load_scenes(script, cache_path=None)
+    assert (scene["name"], scene["duration"], scene["exact"]) == ("Long", 4.0, True)
+
+
+def test_spec_driven_example_scenes():
+    scenes = {scene["name"]: scene for scene in load_scenes(REPO / "taylor_series_hq.py", cache_path=None)}
+    assert scenes["SineExample"]["duration"] == 33.0
+    assert (scenes["HyperbolicExample"]["plays"], scenes["HyperbolicExample"]["duration"]) == (14, 31.0)
+    assert all(scene["exact"] for scene in scenes.values())
+
+
+def test_cache_is_rebuilt_when_the_script_changes(tmp_path):
+    cache_path = tmp_path / "manifest.json"
+    script = write_script(tmp_path, """
+        from manim import *
+
+        class Demo(Scene):
+            def construct(self):
+                self.wait(1)
+    """)
+    assert load_scenes(script, cache_path)[0]["duration"] == 1.0
+    assert json.loads(cache_path.read_text())
+    script.write_text(script.read_text().replace("wait(1)", "wait(2)") + "\n")
+    assert load_scenes(script, cache_path)[0]["duration"] == 2.0
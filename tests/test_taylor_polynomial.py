@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from taylor_polynomial import PartialSums, TaylorPolynomial, coefficients, taylor
+
+
+def test_partial_sums_match_horner():
+    x = np.linspace(-2, 2, 101)
+    sums = PartialSums(coefficients("sin", 15), x)
+    for degree in (1, 3, 5, 9, 15):
+        np.testing.assert_allclose(sums.advance(degree), taylor("sin", degree)(x), atol=1e-13)
+        np.testing.assert_allclose(sums.slopes(), taylor("sin", degree).derivative()(x), atol=1e-13)
+
+
+def test_partial_sums_nonzero_center():
+    c = np.array([1.0, -2.0, 0.5, 3.0])
+    x = np.linspace(0, 2, 11)
+    sums = PartialSums(c, x, center=1.0)
+    polynomial = TaylorPolynomial(c, center=1.0)
+    np.testing.assert_allclose(sums.advance(3), polynomial(x))
+    np.testing.assert_allclose(sums.slopes(), polynomial.derivative()(x))
+
+
+def test_partial_sums_degree_zero():
+    sums = PartialSums([2.0, 1.0], np.arange(3.0))
+    np.testing.assert_array_equal(sums.advance(0), [2, 2, 2])
+    np.testing.assert_array_equal(sums.slopes(), [0, 0, 0])
+
+
+def test_partial_sums_only_move_forward():
+    sums = PartialSums(coefficients("exp", 5), np.arange(3.0))
+    sums.advance(3)
+    with pytest.raises(ValueError):
+        sums.advance(2)
+    with pytest.raises(ValueError):
+        sums.advance(-1)
+
+
+def test_partial_sums_beyond_the_coefficients():
+    with pytest.raises(ValueError):
+        PartialSums(coefficients("exp", 5), np.arange(3.0)).advance(6)
+
+
+def test_partial_sums_return_copies():
+    sums = PartialSums(coefficients("exp", 5), np.arange(3.0))
+    first = sums.advance(1)
+    sums.advance(2)
+    np.testing.assert_array_equal(first, [1, 2, 3])
+
+
+def test_taylor_polynomial():
+    polynomial = TaylorPolynomial([1.0, 2.0, 3.0], center=1.0)
+    assert polynomial(2.0) == 6.0
+    assert isinstance(polynomial(2.0), float)
+    assert polynomial.truncate(1)(3.0) == 5.0
+    assert TaylorPolynomial([4.0]).derivative()(1.0) == 0.0
+    with pytest.raises(ValueError):
+        TaylorPolynomial([])
+
+
+def test_coefficients_grow_the_table():
+    assert len(coefficients("exp", 200)) == 201
+    with pytest.raises(KeyError):
+        coefficients("tan", 3)
@@ -0,0 +1,171 @@
+"""Typeset all of a scene's ``MathTex`` in one LaTeX and one dvisvgm run.
+
+Every ``MathTex`` manim builds writes its own ``.tex`` file and starts a
+``latex`` and a ``dvisvgm`` process for it; at ``-ql`` those process
+starts dominate a scene's construction.  :func:`prepare_math_tex` takes
+the ``MathTex`` arguments a scene is going to use, works out the exact
+LaTeX document manim would write for each, and typesets all the missing
+ones as pages of a single ``standalone`` document with the ``multi``
+option.  One ``dvisvgm`` call splits the pages into SVG files, which are
+renamed to the paths manim looks for, so the ``MathTex`` built later in
+the scene find their SVG already there and skip LaTeX altogether.
+
+Expressions already in :mod:`tex_cache`, or whose SVG manim has already
+produced, are left out.  Templates that are not ``standalone`` documents
+are left to manim, and if the batch fails to compile the expressions
+are typeset one by one as usual, so LaTeX errors are still reported
+against the expression that caused them.  Set ``TAYLOR_TEX_BATCH=off``
+to disable the prepass.
+"""
+import os
+import re
+import subprocess
+import threading
+from pathlib import Path
+
+from manim import MathTex, __version__ as manim_version, config, logger
+from manim.mobject.text import tex_mobject
+from manim.utils.tex_file_writing import compile_tex, tex_hash
+
+from tex_cache import math_tex_is_cached
+from tracing import traced
+
+
+# The recorder replaces this function of manim's tex_mobject module
+if not hasattr(tex_mobject, "tex_to_svg_file"):
+    raise ImportError(
+        f"tex_batch needs manim>=0.19,<0.20, but manim {manim_version} has no tex_mobject.tex_to_svg_file"
+    )
+
+BATCH = os.environ.get("TAYLOR_TEX_BATCH", "").lower() != "off"
+
+# Environment wrapping each page of a batch document
+PAGE_ENVIRONMENT = "manimpage"
+
+_STANDALONE = re.compile(r"\\documentclass(\[[^\]]*\])?\{standalone\}")
+
+
+# Set in a thread while it records what its MathTex would typeset
+_recording = threading.local()
+
+
+class _Recorded(Exception):
+    pass
+
+
+@traced("tex", "batched latex")
+def prepare_math_tex(items):
+    """Typeset every ``(tex_strings, kwargs)`` in ``items`` ahead of its ``MathTex``.
+
+    ``tex_strings`` and ``kwargs`` are the arguments the scene will pass
+    to :func:`~tex_cache.cached_math_tex` or ``MathTex``.  Returns the
+    number of expressions typeset.
+    """
+    if not BATCH:
+        return 0
+    tex_dir = Path(config.get_dir("tex_dir"))
+    # Batch documents by compiler and preamble, each page with the svg
+    # manim will look for
+    batches = {}
+    for tex_strings, kwargs in items:
+        if math_tex_is_cached(*tex_strings, **kwargs):
+            continue
+        expression, environment, template = _tex_to_svg_arguments(tex_strings, kwargs)
+        if environment is not None:
+            texcode = template.get_texcode_for_expression_in_env(expression, environment)
+        else:
+            texcode = template.get_texcode_for_expression(expression)
+        svg_path = tex_dir / f"{tex_hash(texcode)}.svg"
+        if svg_path.exists():
+            continue
+        preamble, _, document = texcode.partition("\\begin{document}")
+        body = document.rpartition("\\end{document}")[0]
+        pages = batches.setdefault((template.tex_compiler, template.output_format, preamble), {})
+        pages.setdefault(svg_path, body)
+
+    typeset = 0
+    for (compiler, output_format, preamble), pages in batches.items():
+        if len(pages) > 1:
+            typeset += _compile_batch(tex_dir, compiler, output_format, preamble, pages)
+    return typeset
+
+
+def _tex_to_svg_arguments(tex_strings, kwargs):
+    """The expression, environment and template ``MathTex(*tex_strings, **kwargs)`` typesets.
+
+    Builds the ``MathTex`` with manim's ``tex_to_svg_file`` recording
+    its arguments, so the expression gets exactly the rewriting manim
+    applies to it, and stops it before anything is compiled.  Only the
+    calling thread records; ``MathTex`` built meanwhile by other threads
+    are typeset as usual.
+    """
+    _recording.active = True
+    try:
+        MathTex(*tex_strings, **kwargs)
+    except _Recorded as recorded:
+        return recorded.args
+    finally:
+        _recording.active = False
+    raise RuntimeError(f"MathTex{tex_strings} typeset nothing")
+
+
+def _record_or_typeset(expression, environment=None, tex_template=None):
+    if getattr(_recording, "active", False):
+        raise _Recorded(expression, environment, tex_template or config.tex_template)
+    return _tex_to_svg_file(expression, environment=environment, tex_template=tex_template)
+
+
+# Installed once here rather than on first use, where two threads could
+# both swap it in and each end up calling the other's recorder
+_tex_to_svg_file = tex_mobject.tex_to_svg_file
+tex_mobject.tex_to_svg_file = _record_or_typeset
+
+
+def _compile_batch(tex_dir, compiler, output_format, preamble, pages):
+    """Typeset ``pages`` (svg path -> document body) as one document; returns the pages made."""
+    match = _STANDALONE.search(preamble)
+    if match is None:
+        return 0
+    options = (match.group(1) or "[]")[1:-1]
+    options = f"{options},multi={PAGE_ENVIRONMENT}" if options else f"multi={PAGE_ENVIRONMENT}"
+    preamble = (
+        f"{preamble[:match.start()]}\\documentclass[{options}]{{standalone}}{preamble[match.end():]}"
+        f"\\newenvironment{{{PAGE_ENVIRONMENT}}}{{}}{{}}\n"
+    )
+    document = preamble + "\\begin{document}\n" + "".join(
+        f"\\begin{{{PAGE_ENVIRONMENT}}}{body}\\end{{{PAGE_ENVIRONMENT}}}\n" for body in pages.values()
+    ) + "\\end{document}\n"
+
+    tex_file = tex_dir / f"batch_{tex_hash(document)}.tex"
+    tex_file.write_text(document, encoding="utf-8")
+    page_files = {}
+    try:
+        try:
+            dvi_file = compile_tex(tex_file, compiler, output_format)
+        except ValueError:
+            logger.warning(f"Batched LaTeX of {len(pages)} expressions failed, typesetting them one by one")
+            return 0
+        command = [
+            "dvisvgm", *(["--pdf"] if output_format == ".pdf" else []), "--page=1-", "--no-fonts",
+            "--verbosity=0", f"--output={tex_file.with_suffix('').as_posix()}-%p.svg", Path(dvi_file).as_posix(),
+        ]
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        # dvisvgm may zero-pad the page numbers
+        page_files = {
+            int(path.stem.rpartition("-")[2]): path for path in tex_dir.glob(f"{tex_file.stem}-*.svg")
+        }
+        if sorted(page_files) != list(range(1, len(pages) + 1)):
+            logger.warning(
+                f"Batched LaTeX produced {len(page_files)} pages for {len(pages)} expressions, "
+                "typesetting them one by one"
+            )
+            return 0
+        for number, svg_path in enumerate(pages, 1):
+            page_files.pop(number).replace(svg_path)
+        return len(pages)
+    finally:
+        for path in page_files.values():
+            path.unlink(missing_ok=True)
+        if not config.no_latex_cleanup:
+            for suffix in (".tex", ".aux", ".log", output_format):
+                tex_file.with_suffix(suffix).unlink(missing_ok=True)
@@ -0,0 +1,295 @@
+"""Persistent cache of typeset ``MathTex`` and ``Text`` mobjects.
+
+Building a ``MathTex`` runs LaTeX and dvisvgm and then parses the SVG;
+building a ``Text`` goes through Pango and the same SVG parser.  The
+scenes create the same formulas, ``P_n`` labels and tick labels on every
+render, so :func:`cached_math_tex` and :func:`cached_text` store the parsed
+result -- the bezier points and colors of every submobject, with its
+class and plain attributes such as ``tex_strings`` -- as a small ``.npz``
+file keyed by the content and style arguments.  Later calls, in this run
+or any later one and from either script, rebuild the mobject from those
+arrays without touching the TeX toolchain, as the same ``MathTex`` or
+``Text`` the constructor returns.
+
+The cache lives in ``~/.cache/manim-taylor-series/tex`` (override with the
+``TAYLOR_TEX_CACHE`` environment variable, or set it to ``off`` to disable
+caching) and is kept under ``TAYLOR_TEX_CACHE_BYTES`` (256 MiB by default)
+by evicting the least recently used entries.
+"""
+import hashlib
+import importlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+from manim import ManimColor, MathTex, Mobject, TexTemplate, Text, VGroup, VMobject, config
+from manim import __version__ as manim_version
+
+from tracing import traced
+
+
+_cache_setting = os.environ.get("TAYLOR_TEX_CACHE", "")
+if _cache_setting.lower() == "off":
+    CACHE_DIR = None
+else:
+    CACHE_DIR = Path(_cache_setting or Path.home() / ".cache" / "manim-taylor-series" / "tex")
+MAX_CACHE_BYTES = int(os.environ.get("TAYLOR_TEX_CACHE_BYTES", 256 * 2**20))
+# Once over the limit, the cache is trimmed to this fraction of it, so that
+# a full cache is not scanned again on every store
+EVICT_TO = 0.9
+
+# Mobjects already loaded in this process, keyed like the files on disk;
+# render_all --pipeline builds scenes in a second thread
+_loaded = {}
+_loaded_lock = threading.Lock()
+
+# Bytes in the cache directory as of the last scan, plus what this process
+# stored since; the directory is only scanned again once it is over the limit
+_cache_bytes = None
+_cache_bytes_lock = threading.Lock()
+
+
+@traced("tex")
+def cached_math_tex(*tex_strings, **kwargs):
+    """``MathTex(*tex_strings, **kwargs)``, served from the cache when possible."""
+    return _cached(MathTex, tex_strings, kwargs, _math_tex_key_parts(tex_strings, kwargs))
+
+
+@traced("tex")
+def cached_text(text, **kwargs):
+    """``Text(text, **kwargs)``, served from the cache when possible."""
+    return _cached(Text, (text,), kwargs, ("Text", text))
+
+
+def math_tex_is_cached(*tex_strings, **kwargs):
+    """Whether :func:`cached_math_tex` with these arguments would skip LaTeX."""
+    key = cache_key(_math_tex_key_parts(tex_strings, kwargs), kwargs)
+    return key in _loaded or (CACHE_DIR is not None and _entry_path(key).exists())
+
+
+def cache_key(key_parts, kwargs):
+    """Content hash identifying one typeset mobject."""
+    style = sorted((name, repr(value)) for name, value in kwargs.items() if name != "tex_template")
+    digest = hashlib.sha256(repr((manim_version, key_parts, style)).encode())
+    return digest.hexdigest()[:24]
+
+
+def _math_tex_key_parts(tex_strings, kwargs):
+    template = kwargs.get("tex_template") or config.tex_template
+    return ("MathTex", tex_strings, getattr(template, "body", repr(template)))
+
+
+def _cached(factory, args, kwargs, key_parts):
+    key = cache_key(key_parts, kwargs)
+    with _loaded_lock:
+        mobject = _loaded.get(key)
+    if mobject is None:
+        mobject = _load(key, kwargs.get("tex_template") or config.tex_template)
+        if mobject is None:
+            mobject = factory(*args, **kwargs)
+            _store(key, mobject)
+        # Another thread may have built the same mobject meanwhile
+        with _loaded_lock:
+            mobject = _loaded.setdefault(key, mobject)
+    return mobject.copy()
+
+
+def _entry_path(key):
+    return CACHE_DIR / f"{key}.npz"
+
+
+def _load(key, tex_template=None):
+    if CACHE_DIR is None:
+        return None
+    path = _entry_path(key)
+    try:
+        with np.load(path) as data:
+            mobject = _from_arrays(data, tex_template)
+    except (OSError, KeyError, ValueError, TypeError, ImportError, AttributeError):
+        return None
+    # Touch the entry so eviction sees it as recently used
+    os.utime(path)
+    return mobject
+
+
+def _store(key, mobject):
+    global _cache_bytes
+    if CACHE_DIR is None:
+        return
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first so concurrent renders never see a
+    # half-written entry
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        np.savez(f, **_to_arrays(mobject))
+        size = f.tell()
+    path = _entry_path(key)
+    try:
+        replaced = path.stat().st_size
+    except FileNotFoundError:
+        replaced = 0
+    os.replace(tmp_path, path)
+    with _cache_bytes_lock:
+        if _cache_bytes is None:
+            _cache_bytes = _evict()
+        else:
+            _cache_bytes += size - replaced
+            if _cache_bytes > MAX_CACHE_BYTES:
+                # Other processes may have stored or evicted entries too
+                _cache_bytes = _evict()
+
+
+def _evict():
+    """Trim the cache to ``EVICT_TO`` of its limit if it is over; returns its size."""
+    entries = []
+    for path in CACHE_DIR.glob("*.npz"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    if total <= MAX_CACHE_BYTES:
+        return total
+    for _, size, path in sorted(entries):
+        if total <= EVICT_TO * MAX_CACHE_BYTES:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+    return total
+
+
+def _to_arrays(mobject):
+    """Flatten a mobject tree into a handful of compact arrays.
+
+    Nodes are stored in depth-first order with their child count, so the
+    tree shape can be rebuilt; points and colors of all nodes are
+    concatenated, with per-node lengths to split them again.  The class
+    and plain attributes of each node go into a JSON string.
+    """
+    nodes = []
+    stack = [mobject]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(reversed(node.submobjects))
+    return {
+        "child_counts": np.array([len(node.submobjects) for node in nodes], dtype=np.int32),
+        "point_counts": np.array([len(node.points) for node in nodes], dtype=np.int32),
+        "points": np.concatenate([node.points for node in nodes]).astype(np.float32),
+        "fill_counts": np.array([len(node.get_fill_rgbas()) for node in nodes], dtype=np.int32),
+        "fill_rgbas": np.concatenate([node.get_fill_rgbas() for node in nodes]).astype(np.float32),
+        "stroke_counts": np.array([len(node.get_stroke_rgbas()) for node in nodes], dtype=np.int32),
+        "stroke_rgbas": np.concatenate([node.get_stroke_rgbas() for node in nodes]).astype(np.float32),
+        "stroke_widths": np.array([node.get_stroke_width() for node in nodes], dtype=np.float32),
+        "nodes": np.array(json.dumps([_node_info(node) for node in nodes])),
+    }
+
+
+# Markers for attribute values JSON has no type for
+_SKIP = object()
+_COLOR = "__color__"
+_CHILDREN = "__children__"
+_TEX_TEMPLATE = "__tex_template__"
+
+
+def _node_info(node):
+    """``[module, class name, attributes]`` of a node, keeping the attributes :func:`_encode` can store."""
+    attributes = {}
+    for name, value in vars(node).items():
+        if name == "submobjects":
+            continue
+        value = _encode(value, node)
+        if value is not _SKIP:
+            attributes[name] = value
+    return [type(node).__module__, type(node).__qualname__, attributes]
+
+
+def _encode(value, node):
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return value.item() if isinstance(value, np.generic) else value
+    if isinstance(value, (list, tuple)):
+        items = [_encode(item, node) for item in value]
+        return _SKIP if any(item is _SKIP for item in items) else items
+    if isinstance(value, dict):
+        if not all(isinstance(name, str) for name in value):
+            return _SKIP
+        items = {name: _encode(item, node) for name, item in value.items()}
+        return _SKIP if any(item is _SKIP for item in items.values()) else items
+    if isinstance(value, ManimColor):
+        return {_COLOR: value.to_hex(with_alpha=True)}
+    if isinstance(value, TexTemplate):
+        # The template is part of the key, so it is the one passed on load
+        return {_TEX_TEMPLATE: True}
+    if isinstance(value, Mobject):
+        # Groups of the node's own children, such as Text.chars
+        indices = {id(child): index for index, child in enumerate(node.submobjects)}
+        if value.submobjects and all(id(child) in indices for child in value.submobjects):
+            return {_CHILDREN: [indices[id(child)] for child in value.submobjects]}
+    return _SKIP
+
+
+def _decode(value, node, tex_template):
+    if isinstance(value, list):
+        return [_decode(item, node, tex_template) for item in value]
+    if isinstance(value, dict):
+        if _COLOR in value:
+            return ManimColor(value[_COLOR])
+        if _TEX_TEMPLATE in value:
+            return tex_template
+        if _CHILDREN in value:
+            return VGroup(*(node.submobjects[index] for index in value[_CHILDREN]))
+        return {name: _decode(item, node, tex_template) for name, item in value.items()}
+    return value
+
+
+def _node_class(module, name):
+    """The class of a stored node; only VMobject subclasses from manim are loaded."""
+    if module != "manim" and not module.startswith("manim."):
+        raise ValueError(f"refusing to load {module}.{name} from the tex cache")
+    cls = getattr(importlib.import_module(module), name)
+    if not (isinstance(cls, type) and issubclass(cls, VMobject)):
+        raise ValueError(f"{module}.{name} is not a VMobject")
+    return cls
+
+
+def _from_arrays(data, tex_template=None):
+    """Rebuild the mobject :func:`_to_arrays` flattened, with the classes it was made of.
+
+    Nodes are created without running their constructors: each starts
+    from the state of a plain ``VGroup`` or ``VMobject`` and gets its
+    class and stored attributes on top.
+    """
+    child_counts = data["child_counts"]
+    node_infos = json.loads(str(data["nodes"]))
+    points = np.split(data["points"].astype(np.float64), np.cumsum(data["point_counts"])[:-1])
+    fills = np.split(data["fill_rgbas"].astype(np.float64), np.cumsum(data["fill_counts"])[:-1])
+    strokes = np.split(data["stroke_rgbas"].astype(np.float64), np.cumsum(data["stroke_counts"])[:-1])
+    stroke_widths = data["stroke_widths"]
+
+    def build(index):
+        children = []
+        next_index = index + 1
+        for _ in range(child_counts[index]):
+            child, next_index = build(next_index)
+            children.append(child)
+        base = VGroup(*children) if children else VMobject()
+        module, name, attributes = node_infos[index]
+        cls = _node_class(module, name)
+        node = cls.__new__(cls)
+        node.__dict__.update(base.__dict__)
+        node.__dict__.update({
+            attribute: _decode(value, node, tex_template) for attribute, value in attributes.items()
+        })
+        node.set_points(points[index])
+        node.fill_rgbas = fills[index]
+        node.stroke_rgbas = strokes[index]
+        node.stroke_width = float(stroke_widths[index])
+        return node, next_index
+
+    return build(0)[0]
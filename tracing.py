@@ -0,0 +1,176 @@
+"""Opt-in timing spans for scene construction, exported as Chrome traces.
+
+Set ``TAYLOR_TRACE`` to a directory to trace every :class:`~taylor_scene.TaylorScene`
+rendered by the process::
+
+    TAYLOR_TRACE=media/traces manim -qh -a taylor_series_hq.py
+
+Each scene's construction, every ``self.play`` and ``self.wait`` (named
+after the line that called it), ``MathTex`` and ``Text`` builds with the
+LaTeX and dvisvgm runs inside them, axes and curve plotting, frame
+rasterization and frame encoding become timed spans.  The spans of all
+scenes rendered by one process are written to
+``<TAYLOR_TRACE>/trace-<pid>.json`` in the Chrome trace-event format
+(open it in ``chrome://tracing`` or https://ui.perfetto.dev), one track
+per scene and thread.  When a scene finishes, the ``TAYLOR_TRACE_TOP``
+(10 by default) spans with the most total time are logged and written to
+``<TAYLOR_TRACE>/<Scene>.summary.json``.
+
+Without ``TAYLOR_TRACE`` nothing is patched and :func:`traced` returns
+the functions it decorates unchanged.
+"""
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+TRACE_DIR = os.environ.get("TAYLOR_TRACE") or None
+TOP_SPANS = int(os.environ.get("TAYLOR_TRACE_TOP", 10))
+
+# Chrome trace events of every scene traced so far, and the scene whose
+# spans are being recorded, as an index into _scenes
+_events = []
+_scenes = []
+_current_scene = None
+_origin = time.perf_counter_ns()
+
+
+@contextmanager
+def span(name, category, **args):
+    """Record the enclosed block as a span of the current scene."""
+    if _current_scene is None:
+        yield
+        return
+    scene = _current_scene
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        end = time.perf_counter_ns()
+        _events.append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - _origin) / 1000,
+            "dur": (end - start) / 1000,
+            "pid": scene,
+            "tid": threading.get_ident(),
+            "args": args,
+        })
+
+
+def traced(category, name=None):
+    """Decorator recording every call of a function as a span, when tracing is on."""
+    def decorate(function):
+        if TRACE_DIR is None:
+            return function
+        span_name = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(span_name, category):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+@contextmanager
+def trace_scene(scene):
+    """Trace the rendering of ``scene``, then write the trace and its summary."""
+    global _current_scene
+    name = type(scene).__name__
+    _scenes.append(name)
+    _current_scene = len(_scenes) - 1
+    scene.construct = traced("scene", "construct")(scene.construct)
+    try:
+        with span("render", "scene"):
+            yield
+    finally:
+        _current_scene = None
+        _write(name, len(_scenes) - 1)
+
+
+def summarize(events, top=TOP_SPANS):
+    """The ``top`` span names with the most total time, with their counts."""
+    totals = {}
+    for event in events:
+        total = totals.setdefault(event["name"], {"name": event["name"], "category": event["cat"],
+                                                  "count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        total["count"] += 1
+        total["total_ms"] += event["dur"] / 1000
+        total["max_ms"] = max(total["max_ms"], event["dur"] / 1000)
+    # The spans covering the whole scene would always come first
+    hottest = [total for total in totals.values() if total["category"] != "scene"]
+    hottest.sort(key=lambda total: total["total_ms"], reverse=True)
+    return [{**total, "total_ms": round(total["total_ms"], 3), "max_ms": round(total["max_ms"], 3)}
+            for total in hottest[:top]]
+
+
+def _write(name, scene):
+    from manim import logger
+
+    trace_dir = Path(TRACE_DIR)
+    trace_dir.mkdir(parents=True, exist_ok=True)
+    metadata = [
+        {"name": "process_name", "ph": "M", "pid": index, "args": {"name": scene_name}}
+        for index, scene_name in enumerate(_scenes)
+    ]
+    with open(trace_dir / f"trace-{os.getpid()}.json", "w") as f:
+        json.dump({"traceEvents": metadata + _events, "displayTimeUnit": "ms"}, f)
+
+    summary = summarize([event for event in _events if event["pid"] == scene])
+    with open(trace_dir / f"{name}.summary.json", "w") as f:
+        json.dump({"scene": name, "top": summary}, f, indent=2)
+    lines = [f"{name}: hottest spans"] + [
+        f"  {total['total_ms']:>10.1f} ms {total['count']:>6}x  {total['name']}" for total in summary
+    ]
+    logger.info("\n".join(lines))
+
+
+def _call_site():
+    # Past the span factory and the patched method, to whoever called it,
+    # skipping TaylorScene's own overrides
+    frame = sys._getframe(3)
+    while frame.f_back is not None and Path(frame.f_code.co_filename).name == "taylor_scene.py":
+        frame = frame.f_back
+    return f"{Path(frame.f_code.co_filename).name}:{frame.f_lineno}"
+
+
+def _patch(owner, attribute, make_span):
+    """Wrap ``owner.attribute`` so each call runs inside ``make_span(*args, **kwargs)``."""
+    original = getattr(owner, attribute)
+
+    @functools.wraps(original)
+    def wrapper(*args, **kwargs):
+        with make_span(*args, **kwargs):
+            return original(*args, **kwargs)
+    setattr(owner, attribute, wrapper)
+
+
+def _install():
+    from manim import CoordinateSystem, MathTex, Scene, Text
+    from manim.utils import tex_file_writing
+
+    def play_span(scene, *animations, **kwargs):
+        names = [type(animation).__name__ for animation in animations]
+        return span(f"play {_call_site()}", "play", animations=names)
+
+    def wait_span(scene, duration=1.0, *args, **kwargs):
+        return span(f"wait {_call_site()}", "play", duration=duration)
+
+    _patch(Scene, "play", play_span)
+    _patch(Scene, "wait", wait_span)
+    _patch(MathTex, "__init__", lambda *args, **kwargs: span("MathTex", "tex"))
+    _patch(Text, "__init__", lambda *args, **kwargs: span("Text", "tex"))
+    _patch(tex_file_writing, "compile_tex", lambda *args, **kwargs: span("latex", "tex"))
+    _patch(tex_file_writing, "convert_to_svg", lambda *args, **kwargs: span("dvisvgm", "tex"))
+    _patch(CoordinateSystem, "plot", lambda *args, **kwargs: span("axes.plot", "plot"))
+
+
+if TRACE_DIR is not None:
+    _install()